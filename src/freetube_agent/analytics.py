@@ -5,12 +5,125 @@ Generates statistics, visualizations, and insights from processed videos.
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable, Iterator, Tuple, Optional, BinaryIO
 from datetime import datetime
-import json
+import os
+import re
+import hashlib
 from collections import Counter
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 
 from .paths import VIDEOS, AUDIO, TRANSCRIPTS
+from .jsonio import dump_json
+
+
+# Common stop words to filter out of word frequency results
+_STOP_WORDS: frozenset[str] = frozenset({
+    'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
+    'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
+    'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
+    'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their',
+    'is', 'was', 'are', 'been', 'has', 'had', 'were', 'can', 'said',
+    'so', 'if', 'about', 'what', 'which', 'when', 'some', 'like', 'just',
+    'into', 'out', 'up', 'them', 'him', 'than', 'who', 'very', 'its',
+    'me', 'your', 'now', 'also', 'over', 'no', 'only', 'how', 'more',
+    'these', 'then', 'could', 'other', 'because', 'much', 'get', 'go',
+    'um', 'uh', 'yeah', 'okay', 'ok', 'gonna', 'wanna', 'gotta'
+})
+
+# Word-frequency tokens (ASCII letters, apostrophes) and non-blank sentences
+_WORD_RE = re.compile(r"[A-Za-z']+")
+_SENT_RE = re.compile(r"[^.!?]*[^.!?\s]")
+
+
+class _TextRef:
+    """
+    Carries transcript content (str or raw bytes) into an lru_cache'd
+    function without making it part of the cache key. All instances compare
+    equal, so the content digest alone decides hits; the content is dropped
+    once the call returns.
+    """
+    __slots__ = ("text",)
+    
+    def __init__(self, text: str | bytes):
+        self.text = text
+    
+    def __hash__(self) -> int:
+        return 0
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _TextRef)
+
+
+def _text_digest(text: str | bytes) -> bytes:
+    """Short content hash used as the cache key for transcript content."""
+    data = text if isinstance(text, bytes) else text.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def _call_cached(func, text: str | bytes, *args):
+    """Call a digest-keyed cached function, releasing the content afterwards."""
+    ref = _TextRef(text)
+    try:
+        return func(_text_digest(text), *args, ref)
+    finally:
+        ref.text = None
+
+
+def _scan_entries(path: Path, suffix: str) -> List[os.DirEntry]:
+    """List directory entries in path whose names end with suffix."""
+    try:
+        with os.scandir(path) as it:
+            return [e for e in it if e.name.endswith(suffix) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _scan_dir(path: Path, suffix: str, executor: Optional[Executor] = None) -> List[Tuple[str, int]]:
+    """Return (name, size) for files in path ending with suffix, one stat per entry."""
+    entries = _scan_entries(path, suffix)
+    mapper = executor.map if executor is not None else map
+    sizes = mapper(lambda e: e.stat().st_size, entries)
+    return [(e.name, size) for e, size in zip(entries, sizes)]
+
+
+def _scan_mtimes(path: Path, suffix: str) -> Iterator[Tuple[str, float]]:
+    """Yield (stem, mtime) for files in path ending with suffix."""
+    for entry in _scan_entries(path, suffix):
+        yield entry.name[:-len(suffix)], entry.stat().st_mtime
+
+
+def _count_words_stream(f: BinaryIO, chunk_size: int = 65536) -> int:
+    """
+    Count whitespace-separated words in a binary file without loading it whole.
+    
+    Reads fixed-size chunks; a word split across a chunk boundary is
+    counted once by checking whether the previous chunk ended mid-word.
+    """
+    count = 0
+    prev_in_word = False
+    for chunk in iter(lambda: f.read(chunk_size), b""):
+        n = len(chunk.split())
+        if n and prev_in_word and not chunk[:1].isspace():
+            n -= 1
+        count += n
+        prev_in_word = not chunk[-1:].isspace()
+    return count
+
+
+def _count_and_size(path: str) -> Tuple[int, int]:
+    """Return (size_bytes, word_count) for a transcript from a single open."""
+    try:
+        with open(path, "rb") as f:
+            return os.fstat(f.fileno()).st_size, _count_words_stream(f)
+    except OSError:
+        return 0, 0
+
+
+def _max_io_workers() -> int:
+    """Thread count for I/O-bound per-file work."""
+    return min(32, (os.cpu_count() or 1) * 4)
 
 
 def get_library_stats() -> Dict[str, Any]:
@@ -20,29 +133,33 @@ def get_library_stats() -> Dict[str, Any]:
     Returns:
         Dictionary with library statistics
     """
-    videos = list(VIDEOS.glob("*.mp4"))
-    audios = list(AUDIO.glob("*.wav"))
-    transcripts = list(TRANSCRIPTS.glob("*.txt"))
-    
-    # Calculate file sizes
-    total_video_size = sum(v.stat().st_size for v in videos)
-    total_audio_size = sum(a.stat().st_size for a in audios)
-    total_transcript_size = sum(t.stat().st_size for t in transcripts)
+    # One scandir pass per directory; per-file stat/read work runs on a
+    # thread pool so the disk queue stays full on large libraries
+    with ThreadPoolExecutor(max_workers=_max_io_workers()) as ex:
+        video_sizes = _scan_dir(VIDEOS, ".mp4", ex)
+        audio_sizes = _scan_dir(AUDIO, ".wav", ex)
+        transcript_entries = _scan_entries(TRANSCRIPTS, ".txt")
+        transcript_stats = list(ex.map(_count_and_size, (e.path for e in transcript_entries)))
+    
+    videos = [{"name": name, "size_mb": size / (1024 * 1024)} for name, size in video_sizes]
+    total_video_size = sum(size for _, size in video_sizes)
+    
+    audio_count = len(audio_sizes)
+    total_audio_size = sum(size for _, size in audio_sizes)
+    
+    transcripts = [
+        {"name": e.name, "size_kb": size / 1024}
+        for e, (size, _) in zip(transcript_entries, transcript_stats)
+    ]
+    total_transcript_size = sum(size for size, _ in transcript_stats)
     
     # Calculate total duration from transcripts (if they have segments)
     total_duration = 0
-    total_words = 0
-    
-    for transcript in transcripts:
-        try:
-            content = transcript.read_text(encoding="utf-8")
-            total_words += len(content.split())
-        except Exception:
-            pass
+    total_words = sum(words for _, words in transcript_stats)
     
     return {
         "video_count": len(videos),
-        "audio_count": len(audios),
+        "audio_count": audio_count,
         "transcript_count": len(transcripts),
         "total_video_size_mb": total_video_size / (1024 * 1024),
         "total_audio_size_mb": total_audio_size / (1024 * 1024),
@@ -50,8 +167,8 @@ def get_library_stats() -> Dict[str, Any]:
         "total_size_mb": (total_video_size + total_audio_size + total_transcript_size) / (1024 * 1024),
         "total_words": total_words,
         "avg_words_per_transcript": total_words / len(transcripts) if transcripts else 0,
-        "videos": [{"name": v.name, "size_mb": v.stat().st_size / (1024*1024)} for v in videos],
-        "transcripts": [{"name": t.name, "size_kb": t.stat().st_size / 1024} for t in transcripts],
+        "videos": videos,
+        "transcripts": transcripts,
     }
 
 
@@ -66,32 +183,27 @@ def get_word_frequency(transcript_text: str, top_n: int = 50) -> List[tuple]:
     Returns:
         List of (word, count) tuples
     """
-    # Common stop words to filter out
-    stop_words = {
-        'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
-        'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
-        'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
-        'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their',
-        'is', 'was', 'are', 'been', 'has', 'had', 'were', 'can', 'said',
-        'so', 'if', 'about', 'what', 'which', 'when', 'some', 'like', 'just',
-        'into', 'out', 'up', 'them', 'him', 'than', 'who', 'very', 'its',
-        'me', 'your', 'now', 'also', 'over', 'no', 'only', 'how', 'more',
-        'these', 'then', 'could', 'other', 'because', 'much', 'get', 'go',
-        'um', 'uh', 'yeah', 'okay', 'ok', 'gonna', 'wanna', 'gotta'
-    }
-    
-    # Tokenize and clean
-    words = transcript_text.lower().split()
-    filtered_words = [
-        word.strip('.,!?;:"()[]{}')
-        for word in words
-        if len(word.strip('.,!?;:"()[]{}')) > 3
-        and word.strip('.,!?;:"()[]{}').lower() not in stop_words
-        and word.strip('.,!?;:"()[]{}').isalpha()
-    ]
-    
-    # Count frequency
-    word_counts = Counter(filtered_words)
+    return list(_call_cached(_word_freq_cached, transcript_text, top_n))
+
+
+@lru_cache(maxsize=256)
+def _word_freq_cached(digest: bytes, top_n: int, ref: _TextRef) -> Tuple[tuple, ...]:
+    return tuple(_word_freq_impl(ref.text, top_n))
+
+
+def _word_freq_impl(transcript_text: str, top_n: int) -> List[tuple]:
+    # Tokenize, lowercase and drop punctuation in a single regex pass; finditer
+    # feeds Counter incrementally instead of materializing a token list
+    tokens = (m.group() for m in _WORD_RE.finditer(transcript_text.lower()))
+    return _top_words(tokens, top_n)
+
+
+def _top_words(tokens: Iterable[str], top_n: int) -> List[tuple]:
+    """Count content words (alphabetic, 4+ letters, not stop words) in lowercased tokens."""
+    word_counts = Counter(
+        t for t in tokens
+        if len(t) > 3 and t not in _STOP_WORDS and t.isalpha()
+    )
     return word_counts.most_common(top_n)
 
 
@@ -105,23 +217,43 @@ def analyze_transcript(transcript_text: str) -> Dict[str, Any]:
     Returns:
         Dictionary with analysis results
     """
+    analysis = _call_cached(_analyze_cached, transcript_text)
+    # Hand out a copy so callers can annotate results without touching the cache
+    return {**analysis, "top_words": list(analysis["top_words"])}
+
+
+@lru_cache(maxsize=256)
+def _analyze_cached(digest: bytes, ref: _TextRef) -> Dict[str, Any]:
+    return _analyze_impl(ref.text)
+
+
+@lru_cache(maxsize=128)
+def _analyze_raw_cached(digest: bytes, ref: _TextRef) -> Dict[str, Any]:
+    # Decode the way Path.read_text does, including universal newlines
+    text = ref.text.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return analyze_transcript(text)
+
+
+def _analyze_impl(transcript_text: str) -> Dict[str, Any]:
+    # Words are whitespace-separated, as in get_library_stats and the exports;
+    # only word frequency uses the regex tokens
+    lower = transcript_text.lower()
     words = transcript_text.split()
-    sentences = transcript_text.split('.')
     
     # Basic stats
     word_count = len(words)
     char_count = len(transcript_text)
-    sentence_count = len([s for s in sentences if s.strip()])
+    sentence_count = len(_SENT_RE.findall(transcript_text))
     
     # Word frequency
-    top_words = get_word_frequency(transcript_text, 20)
+    top_words = _top_words(_WORD_RE.findall(lower), 20)
     
     # Average metrics
-    avg_word_length = sum(len(word) for word in words) / word_count if word_count > 0 else 0
+    avg_word_length = sum(map(len, words)) / word_count if word_count > 0 else 0
     avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
     
     # Unique words
-    unique_words = len(set(word.lower().strip('.,!?;:"()[]{}') for word in words))
+    unique_words = len({word.strip('.,!?;:"()[]{}') for word in lower.split()})
     vocabulary_richness = unique_words / word_count if word_count > 0 else 0
     
     return {
@@ -163,20 +295,20 @@ def get_processing_timeline() -> List[Dict[str, Any]]:
     Returns:
         List of file processing events
     """
-    timeline = []
+    # Sort raw float mtimes; datetimes are only built for the sorted output
+    raw = [(mtime, stem) for stem, mtime in _scan_mtimes(TRANSCRIPTS, ".txt")]
+    raw.sort(reverse=True)
     
-    for transcript in TRANSCRIPTS.glob("*.txt"):
-        mod_time = datetime.fromtimestamp(transcript.stat().st_mtime)
+    timeline = []
+    for mtime, stem in raw:
+        mod_time = datetime.fromtimestamp(mtime)
         timeline.append({
-            "name": transcript.stem,
+            "name": stem,
             "type": "transcript",
             "timestamp": mod_time,
             "date_str": mod_time.strftime("%Y-%m-%d %H:%M"),
         })
     
-    # Sort by time
-    timeline.sort(key=lambda x: x["timestamp"], reverse=True)
-    
     return timeline
 
 
@@ -193,27 +325,30 @@ def get_activity_summary(days: int = 30) -> Dict[str, Any]:
     from datetime import timedelta
     
     now = datetime.now()
-    cutoff = now - timedelta(days=days)
-    
-    recent_transcripts = []
-    for transcript in TRANSCRIPTS.glob("*.txt"):
-        mod_time = datetime.fromtimestamp(transcript.stat().st_mtime)
-        if mod_time >= cutoff:
-            recent_transcripts.append({
-                "name": transcript.stem,
-                "date": mod_time.strftime("%Y-%m-%d"),
-                "time": mod_time.strftime("%H:%M"),
-            })
+    cutoff_ts = (now - timedelta(days=days)).timestamp()
+    
+    # Filter and sort on raw float timestamps before any datetime work
+    recent = [(mtime, stem) for stem, mtime in _scan_mtimes(TRANSCRIPTS, ".txt") if mtime >= cutoff_ts]
+    recent.sort(reverse=True)
     
     # Group by date
-    date_counts = Counter(t["date"] for t in recent_transcripts)
+    dates = [datetime.fromtimestamp(mtime).strftime("%Y-%m-%d") for mtime, _ in recent]
+    date_counts = Counter(dates)
+    
+    recent_items = []
+    for (mtime, stem), date in zip(recent[:10], dates):
+        recent_items.append({
+            "name": stem,
+            "date": date,
+            "time": datetime.fromtimestamp(mtime).strftime("%H:%M"),
+        })
     
     return {
         "period_days": days,
-        "total_processed": len(recent_transcripts),
+        "total_processed": len(recent),
         "daily_activity": dict(date_counts),
-        "avg_per_day": len(recent_transcripts) / days if days > 0 else 0,
-        "recent_items": sorted(recent_transcripts, key=lambda x: x["date"], reverse=True)[:10],
+        "avg_per_day": len(recent) / days if days > 0 else 0,
+        "recent_items": recent_items,
     }
 
 
@@ -227,16 +362,25 @@ def compare_transcripts(transcript_paths: List[Path]) -> Dict[str, Any]:
     Returns:
         Dictionary with comparison data
     """
-    comparisons = []
-    
-    for path in transcript_paths:
+    def _analyze_path(path: Path) -> Optional[Dict[str, Any]]:
         try:
-            content = path.read_text(encoding="utf-8")
-            analysis = analyze_transcript(content)
-            analysis["name"] = path.stem
-            comparisons.append(analysis)
+            # Hash the raw bytes so files already analyzed (or identical
+            # copies) are served from cache without decoding
+            analysis = _call_cached(_analyze_raw_cached, path.read_bytes())
+            return {**analysis, "top_words": list(analysis["top_words"]), "name": path.stem}
         except Exception:
-            continue
+            return None
+    
+    # Per-file work is independent; repeated paths are analyzed once
+    unique_paths = list(dict.fromkeys(transcript_paths))
+    with ThreadPoolExecutor(max_workers=_max_io_workers()) as ex:
+        by_path = dict(zip(unique_paths, ex.map(_analyze_path, unique_paths)))
+    
+    comparisons = [
+        {**by_path[path], "top_words": list(by_path[path]["top_words"])}
+        for path in transcript_paths
+        if by_path[path] is not None
+    ]
     
     return {
         "count": len(comparisons),
@@ -272,7 +416,6 @@ def export_analytics_report(output_path: Optional[Path] = None) -> Path:
         "activity_7d": get_activity_summary(7),
     }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    dump_json(report, output_path)
     
     return output_path
@@ -1,9 +1,8 @@
 from pathlib import Path
-import os
 import subprocess
 import shutil
 import time
-import ffmpeg
+from functools import lru_cache
 
 from .paths import AUDIO
 from .logger import logger, error_tracker, retry, perf_logger
@@ -13,72 +12,104 @@ from .logger import logger, error_tracker, retry, perf_logger
 def extract_audio(video_path: str | Path, output_path: str | Path | None = None) -> Path:
     """
     Extract audio as WAV (16kHz mono) from a video.
-    Prefers ffmpeg-python with system ffmpeg; falls back to imageio-ffmpeg binary.
+    Runs the system ffmpeg binary directly; falls back to the imageio-ffmpeg binary.
     """
     start_time = time.time()
-    
+
     vpath = Path(video_path)
     logger.info(f"Extracting audio from: {vpath.name}")
-    
+
     if output_path is None:
         out = AUDIO / (vpath.stem + ".wav")
     else:
         out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    if _has_ffmpeg_on_path():
-        try:
-            logger.debug("Using system ffmpeg for audio extraction")
-            (
-                ffmpeg
-                .input(str(vpath))
-                .output(str(out), acodec="pcm_s16le", ac=1, ar="16000")
-                .overwrite_output()
-                .run(quiet=True)
-            )
-            duration = time.time() - start_time
-            logger.info(f"Audio extracted successfully (ffmpeg): {out.name} in {duration:.1f}s")
-            perf_logger.log_metric("extract_audio", duration, True, {"method": "system_ffmpeg"})
-            return out
-        except Exception as e:
-            logger.warning(f"System ffmpeg failed: {e}, trying bundled ffmpeg")
-            error_tracker.log_error(e, context="System ffmpeg extraction", module="audio", function="extract_audio")
-
-    # Fallback: use bundled imageio-ffmpeg executable
     try:
-        logger.debug("Using bundled imageio-ffmpeg for audio extraction")
-        import imageio_ffmpeg
-
-        exe = imageio_ffmpeg.get_ffmpeg_exe()
+        method, exe = _resolve_ffmpeg()
     except Exception as e:
         logger.error("FFmpeg not available. Install system FFmpeg or imageio-ffmpeg.")
         error_tracker.log_error(e, context="FFmpeg not available", module="audio", function="extract_audio")
         raise RuntimeError("FFmpeg not available. Install system FFmpeg or imageio-ffmpeg.") from e
+    logger.debug(f"Using {method} for audio extraction")
+
+    # -vn skips decoding the video stream entirely; -threads 0 lets ffmpeg use all cores
+    args = [
+        "-y",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-i",
+        str(vpath),
+        "-vn",
+        "-acodec",
+        "pcm_s16le",
+        "-ac",
+        "1",
+        "-ar",
+        "16000",
+        "-threads",
+        "0",
+        str(out),
+    ]
+
+    if method == "system_ffmpeg":
+        try:
+            return _run_ffmpeg(exe, args, out, method, start_time)
+        except Exception as e:
+            # The PATH ffmpeg may lack a codec or be a broken shim
+            logger.warning(f"System ffmpeg failed: {_ffmpeg_error(e)}, trying bundled ffmpeg")
+            error_tracker.log_error(e, context="System ffmpeg extraction", module="audio", function="extract_audio")
+        try:
+            import imageio_ffmpeg
+
+            method, exe = "bundled_ffmpeg", imageio_ffmpeg.get_ffmpeg_exe()
+        except Exception as e:
+            logger.error("Bundled ffmpeg not available after system ffmpeg failed.")
+            error_tracker.log_error(e, context="FFmpeg not available", module="audio", function="extract_audio")
+            raise RuntimeError("Audio extraction failed: system ffmpeg failed and imageio-ffmpeg is not available.") from e
+        logger.debug(f"Using {method} for audio extraction")
 
     try:
-        cmd = [
-            exe,
-            "-y",
-            "-i",
-            str(vpath),
-            "-acodec",
-            "pcm_s16le",
-            "-ac",
-            "1",
-            "-ar",
-            "16000",
-            str(out),
-        ]
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        duration = time.time() - start_time
-        logger.info(f"Audio extracted successfully (bundled): {out.name} in {duration:.1f}s")
-        perf_logger.log_metric("extract_audio", duration, True, {"method": "bundled_ffmpeg"})
-        return out
+        return _run_ffmpeg(exe, args, out, method, start_time)
     except Exception as e:
-        logger.error(f"Audio extraction failed: {e}")
-        error_tracker.log_error(e, context="Bundled ffmpeg extraction", module="audio", function="extract_audio")
+        err = _ffmpeg_error(e)
+        logger.error(f"Audio extraction failed: {err}")
+        error_tracker.log_error(e, context=f"ffmpeg extraction ({method}): {err}", module="audio", function="extract_audio")
+        if isinstance(e, subprocess.CalledProcessError):
+            raise RuntimeError(f"Audio extraction failed: {err}") from e
         raise
 
 
-def _has_ffmpeg_on_path() -> bool:
-    return shutil.which("ffmpeg") is not None
+def _run_ffmpeg(exe: str, args: list[str], out: Path, method: str, start_time: float) -> Path:
+    """Run one ffmpeg invocation and record its timing."""
+    subprocess.run([exe, *args], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    duration = time.time() - start_time
+    logger.info(f"Audio extracted successfully ({method}): {out.name} in {duration:.1f}s")
+    perf_logger.log_metric("extract_audio", duration, True, {"method": method})
+    return out
+
+
+def _ffmpeg_error(e: Exception) -> str:
+    """Return ffmpeg's stderr for a failed run, or the exception text."""
+    if isinstance(e, subprocess.CalledProcessError):
+        return (e.stderr or b"").decode("utf-8", errors="replace").strip() or str(e)
+    return str(e)
+
+
+@lru_cache(maxsize=1)
+def _resolve_ffmpeg() -> tuple[str, str]:
+    """
+    Locate the ffmpeg binary once per process.
+
+    Returns:
+        (method, executable path) - system ffmpeg when on PATH, otherwise
+        the imageio-ffmpeg bundled binary
+    """
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return "system_ffmpeg", exe
+    # Fallback: use bundled imageio-ffmpeg executable
+    import imageio_ffmpeg
+
+    return "bundled_ffmpeg", imageio_ffmpeg.get_ffmpeg_exe()
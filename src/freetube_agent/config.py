@@ -6,10 +6,10 @@ Handles loading, saving, and managing user preferences.
 from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Any, Optional
-import json
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 
 from .paths import DATA
+from .jsonio import dump_json, load_json
 
 
 @dataclass
@@ -66,16 +66,61 @@ class ConfigManager:
         if config_path is None:
             config_path = DATA / "config.json"
         self.config_path = config_path
+        self.config: Optional[AppConfig] = None
+        self._mtime_ns: Optional[int] = None
         self.config = self.load()
+        self._dirty = False
+        self._batch_depth = 0
+    
+    def __enter__(self) -> "ConfigManager":
+        """Defer saves until the outermost ``with`` block exits.
+        
+        Example:
+            with get_config_manager() as cm:
+                cm.update_ui(theme="light")
+                cm.update_llm(temperature=0.5)  # one write on exit
+        """
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.commit()
+        return False
+    
+    def commit(self) -> bool:
+        """Write pending updates to disk, if any"""
+        if not self._dirty:
+            return True
+        return self.save()
+    
+    def _mark_dirty(self) -> bool:
+        """Record a pending update; save now unless inside a batch"""
+        self._dirty = True
+        if self._batch_depth > 0:
+            return True
+        return self.commit()
     
     def load(self) -> AppConfig:
-        """Load configuration from file or create default"""
-        if not self.config_path.exists():
-            return AppConfig()
+        """Load configuration from file or create default.
+        
+        Returns the already-loaded config without re-parsing when the
+        file's mtime has not changed since the last load or save. A missing
+        or unreadable file keeps the loaded config; defaults are only
+        created on the first load.
+        """
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError:
+            self._mtime_ns = None
+            return self.config if self.config is not None else AppConfig()
+        
+        if self.config is not None and mtime_ns == self._mtime_ns:
+            return self.config
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(self.config_path)
             
             # Reconstruct dataclasses
             config = AppConfig(
@@ -85,11 +130,34 @@ class ConfigManager:
                 ui=UIConfig(**data.get('ui', {})),
                 version=data.get('version', '1.0')
             )
+            self._mtime_ns = mtime_ns
             return config
         
         except Exception as e:
             print(f"Warning: Failed to load config from {self.config_path}: {e}")
-            return AppConfig()
+            # Don't re-parse the same broken file on every call
+            self._mtime_ns = mtime_ns
+            return self.config if self.config is not None else AppConfig()
+    
+    def refresh(self) -> AppConfig:
+        """Pick up external edits to the config file (a single stat when unchanged)"""
+        if not self._dirty:
+            self.config = self.load()
+        return self.config
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Serialize the config to plain dicts.
+        
+        The section dataclasses only hold scalars, so a shallow copy of each
+        instance __dict__ is enough; asdict() would deep-copy every field.
+        """
+        return {
+            'transcription': dict(vars(self.config.transcription)),
+            'semantic_search': dict(vars(self.config.semantic_search)),
+            'llm': dict(vars(self.config.llm)),
+            'ui': dict(vars(self.config.ui)),
+            'version': self.config.version
+        }
     
     def save(self, config: Optional[AppConfig] = None) -> bool:
         """Save configuration to file"""
@@ -101,18 +169,13 @@ class ConfigManager:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Convert to dict
-            data = {
-                'transcription': asdict(self.config.transcription),
-                'semantic_search': asdict(self.config.semantic_search),
-                'llm': asdict(self.config.llm),
-                'ui': asdict(self.config.ui),
-                'version': self.config.version
-            }
+            data = self._to_dict()
             
             # Write to file
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            dump_json(data, self.config_path)
             
+            self._mtime_ns = self.config_path.stat().st_mtime_ns
+            self._dirty = False
             return True
         
         except Exception as e:
@@ -124,28 +187,28 @@ class ConfigManager:
         for key, value in kwargs.items():
             if hasattr(self.config.transcription, key):
                 setattr(self.config.transcription, key, value)
-        return self.save()
+        return self._mark_dirty()
     
     def update_semantic_search(self, **kwargs) -> bool:
         """Update semantic search settings"""
         for key, value in kwargs.items():
             if hasattr(self.config.semantic_search, key):
                 setattr(self.config.semantic_search, key, value)
-        return self.save()
+        return self._mark_dirty()
     
     def update_llm(self, **kwargs) -> bool:
         """Update LLM settings"""
         for key, value in kwargs.items():
             if hasattr(self.config.llm, key):
                 setattr(self.config.llm, key, value)
-        return self.save()
+        return self._mark_dirty()
     
     def update_ui(self, **kwargs) -> bool:
         """Update UI settings"""
         for key, value in kwargs.items():
             if hasattr(self.config.ui, key):
                 setattr(self.config.ui, key, value)
-        return self.save()
+        return self._mark_dirty()
     
     def reset_to_defaults(self) -> bool:
         """Reset all settings to defaults"""
@@ -155,15 +218,8 @@ class ConfigManager:
     def export_config(self, path: Path) -> bool:
         """Export config to a specific path"""
         try:
-            data = {
-                'transcription': asdict(self.config.transcription),
-                'semantic_search': asdict(self.config.semantic_search),
-                'llm': asdict(self.config.llm),
-                'ui': asdict(self.config.ui),
-                'version': self.config.version
-            }
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            data = self._to_dict()
+            dump_json(data, path)
             return True
         except Exception as e:
             print(f"Error exporting config: {e}")
@@ -171,12 +227,8 @@ class ConfigManager:
     
     def import_config(self, path: Path) -> bool:
         """Import config from a specific path"""
-        if not path.exists():
-            return False
-        
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(path)
             
             self.config = AppConfig(
                 transcription=TranscriptionConfig(**data.get('transcription', {})),
@@ -186,6 +238,8 @@ class ConfigManager:
                 version=data.get('version', '1.0')
             )
             return self.save()
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error importing config: {e}")
             return False
@@ -205,7 +259,7 @@ def get_config_manager() -> ConfigManager:
 
 def get_config() -> AppConfig:
     """Get the current configuration"""
-    return get_config_manager().config
+    return get_config_manager().refresh()
 
 
 def save_config() -> bool:
@@ -1,43 +1,64 @@
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
+import atexit
+import os
+import re
 import shutil
-from typing import Optional, Callable, Dict, Any
-
-from pytube import YouTube
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from functools import lru_cache
+from typing import Optional, Callable, Dict, Any, List
 
 from .paths import VIDEOS
 from .logger import logger, error_tracker, retry
 
 
+# Minimum seconds between progress callbacks during a download
+_PROGRESS_INTERVAL = 0.1
+
+# Parallel byte-range fetching of a single pytube stream
+_RANGED_PARTS = 8
+_RANGED_MIN_SIZE = 4 * 1024 * 1024
+
+# yt-dlp transfer tuning shared by every download
+_YTDLP_TRANSFER_OPTS = {
+    "concurrent_fragment_downloads": 8,
+    "http_chunk_size": 10 * 1024 * 1024,
+    "retries": 10,
+    "fragment_retries": 10,
+}
+
+# Idle YoutubeDL instances shared process-wide, keyed by option set
+# (output dir excluded): constructing one loads every extractor, and an
+# instance is not thread-safe, so each download checks one out exclusively
+_YDL_IDLE: "OrderedDict[str, List[tuple]]" = OrderedDict()
+_YDL_LOCK = threading.Lock()
+_YDL_MAX_IDLE = 4
+
+# Video id from youtu.be/<id>, /shorts/<id> or watch?...v=<id> in one pass
+_YT_ID_RE = re.compile(
+    r"(?:youtu\.be/|/shorts/|youtube\.com/watch\?(?:[^#]*?&)?v=)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+
+
+@lru_cache(maxsize=1024)
 def normalize_yt_url(url: str) -> str:
     """Normalize YouTube URLs: handle shorts and youtu.be to watch?v=.."""
     u = url.strip()
-    if not u:
-        return u
-    # Convert youtu.be/<id> to watch?v=<id>
-    if "youtu.be/" in u:
-        vid = u.split("youtu.be/")[-1].split("?")[0].split("&")[0]
-        return f"https://www.youtube.com/watch?v={vid}"
-    # Convert shorts to watch
-    if "/shorts/" in u:
-        vid = u.split("/shorts/")[-1].split("?")[0].split("&")[0]
-        return f"https://www.youtube.com/watch?v={vid}"
-    # Strip playlist params; keep only v
-    try:
-        parts = urlparse(u)
-        if parts.netloc.endswith("youtube.com") and parts.path == "/watch":
-            qs = parse_qs(parts.query)
-            v = (qs.get("v") or [None])[0]
-            if v:
-                return f"https://www.youtube.com/watch?v={v}"
-    except Exception:
-        pass
+    m = _YT_ID_RE.search(u)
+    if m:
+        return f"https://www.youtube.com/watch?v={m.group(1)}"
     return u
 
 
 def _download_with_pytube(url: str, out_dir: Path, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Path | None:
     logger.info(f"Attempting download with pytube: {url}")
     try:
+        from pytube import YouTube
+
         yt = YouTube(url)
         # Prefer progressive mp4 streams which contain both audio+video
         stream = (
@@ -59,11 +80,20 @@ def _download_with_pytube(url: str, out_dir: Path, progress: Optional[Callable[[
     except Exception as e:
         logger.warning(f"Pytube failed: {e}")
         return None
+    on_prog = None
     if progress is not None:
         total = stream.filesize or 0
 
+        last_emit = 0.0
+
         def on_prog(s, chunk, bytes_remaining):
+            nonlocal last_emit
             try:
+                # Throttle to ~10 updates/s; always report the final chunk
+                now = time.monotonic()
+                if bytes_remaining and now - last_emit < _PROGRESS_INTERVAL:
+                    return
+                last_emit = now
                 tot = total or getattr(s, "filesize", 0) or 0
                 downloaded = max(0, tot - int(bytes_remaining)) if tot else 0
                 pct = (downloaded / tot * 100.0) if tot else None
@@ -79,6 +109,26 @@ def _download_with_pytube(url: str, out_dir: Path, progress: Optional[Callable[[
 
         yt.register_on_progress_callback(on_prog)
 
+    # Fetch the stream over parallel byte-range connections; pytube's own
+    # single-connection download gets throttled, so it is only the fallback
+    try:
+        size = stream.filesize or 0
+        if size >= _RANGED_MIN_SIZE:
+            target = out_dir / stream.default_filename
+            received = 0
+
+            def on_bytes(n: int) -> None:
+                nonlocal received
+                received += n
+                if on_prog is not None:
+                    on_prog(stream, None, size - received)
+
+            _download_ranged(stream.url, target, size, on_bytes)
+            logger.info(f"Pytube ranged download successful: {target}")
+            return target
+    except Exception as e:
+        logger.warning(f"Ranged download failed, using pytube's downloader: {e}")
+
     try:
         target = stream.download(output_path=str(out_dir))
         logger.info(f"Pytube download successful: {target}")
@@ -89,6 +139,56 @@ def _download_with_pytube(url: str, out_dir: Path, progress: Optional[Callable[[
         return None
 
 
+def _download_ranged(url: str, target: Path, size: int, on_bytes: Callable[[int], None]) -> None:
+    """
+    Download url into target using _RANGED_PARTS concurrent HTTP Range requests.
+
+    Runs its own event loop so callers stay synchronous. Each range is
+    streamed straight to its offset in a preallocated file.
+    """
+    import asyncio
+    import httpx
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("cannot start a ranged download inside a running event loop")
+
+    part = -(-size // _RANGED_PARTS)
+    ranges = [(lo, min(lo + part, size) - 1) for lo in range(0, size, part)]
+
+    async def fetch(client: "httpx.AsyncClient", lo: int, hi: int) -> None:
+        async with client.stream("GET", url, headers={"Range": f"bytes={lo}-{hi}"}) as resp:
+            if resp.status_code != 206:
+                raise RuntimeError(f"server ignored range request (HTTP {resp.status_code})")
+            written = 0
+            with open(target, "r+b") as f:
+                f.seek(lo)
+                async for chunk in resp.aiter_bytes(1 << 20):
+                    f.write(chunk)
+                    written += len(chunk)
+                    on_bytes(len(chunk))
+        if written != hi - lo + 1:
+            raise RuntimeError(f"range {lo}-{hi} incomplete: got {written} bytes")
+
+    async def run() -> None:
+        limits = httpx.Limits(max_connections=_RANGED_PARTS * 2)
+        async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(30.0), follow_redirects=True) as client:
+            await asyncio.gather(*(fetch(client, lo, hi) for lo, hi in ranges))
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "wb") as f:
+        f.truncate(size)
+    try:
+        asyncio.run(run())
+    except BaseException:
+        target.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
 def _get_ffmpeg_exe() -> Optional[str]:
     exe = shutil.which("ffmpeg")
     if exe:
@@ -101,10 +201,75 @@ def _get_ffmpeg_exe() -> Optional[str]:
         return None
 
 
+def _close_ydl(ydl) -> None:
+    try:
+        ydl.close()
+    except Exception:
+        pass
+
+
+@contextmanager
+def _borrow_ydl(ydl_opts: Dict[str, Any], out_dir: Path):
+    """
+    Check out an idle YoutubeDL for ydl_opts, creating one if none is free.
+
+    The instance writes into out_dir for the duration of the block and is
+    then returned to the shared pool; the pool keeps at most _YDL_MAX_IDLE
+    instances and closes the least recently used beyond that.
+
+    Yields:
+        (ydl, hook_slot) - assign a callback to hook_slot[0] to receive the
+        instance's progress events for the current download
+    """
+    key = repr(sorted(ydl_opts.items()))
+    entry = None
+    with _YDL_LOCK:
+        idle = _YDL_IDLE.get(key)
+        if idle:
+            entry = idle.pop()
+            if not idle:
+                del _YDL_IDLE[key]
+    if entry is None:
+        from yt_dlp import YoutubeDL
+
+        ydl = YoutubeDL(ydl_opts)
+        hook_slot: List[Optional[Callable[[Dict[str, Any]], None]]] = [None]
+        # Fragment downloads may report from other threads, so the active
+        # callback lives on the instance rather than in thread-local state
+        ydl.add_progress_hook(lambda d: hook_slot[0] and hook_slot[0](d))
+        entry = (ydl, hook_slot)
+
+    ydl, hook_slot = entry
+    # outtmpl is relative; yt-dlp resolves it against paths["home"] per download
+    ydl.params["paths"] = {"home": str(out_dir)}
+    try:
+        yield entry
+    finally:
+        hook_slot[0] = None
+        evicted = []
+        with _YDL_LOCK:
+            _YDL_IDLE.setdefault(key, []).append(entry)
+            _YDL_IDLE.move_to_end(key)
+            while sum(map(len, _YDL_IDLE.values())) > _YDL_MAX_IDLE:
+                oldest = next(iter(_YDL_IDLE))
+                evicted.append(_YDL_IDLE[oldest].pop(0))
+                if not _YDL_IDLE[oldest]:
+                    del _YDL_IDLE[oldest]
+        for old, _ in evicted:
+            _close_ydl(old)
+
+
+@atexit.register
+def _close_shared_ydls() -> None:
+    with _YDL_LOCK:
+        entries = [e for idle in _YDL_IDLE.values() for e in idle]
+        _YDL_IDLE.clear()
+    for ydl, _ in entries:
+        _close_ydl(ydl)
+
+
 @retry(max_attempts=2, delay=2.0, exceptions=(RuntimeError, ConnectionError))
 def _download_with_ytdlp(url: str, out_dir: Path, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Path:
-    from yt_dlp import YoutubeDL
-
     logger.info(f"Downloading with yt-dlp: {url}")
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -112,7 +277,7 @@ def _download_with_ytdlp(url: str, out_dir: Path, progress: Optional[Callable[[D
     # If ffmpeg is available, allow separate A/V merge into MP4; otherwise avoid merging.
     if ffmpeg_exe:
         ydl_opts = {
-            "outtmpl": str(out_dir / "%(title)s.%(ext)s"),
+            "outtmpl": "%(title)s.%(ext)s",
             "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
             "merge_output_format": "mp4",
             "noplaylist": True,
@@ -123,19 +288,37 @@ def _download_with_ytdlp(url: str, out_dir: Path, progress: Optional[Callable[[D
     else:
         # No ffmpeg: select a single progressive stream to avoid merging.
         ydl_opts = {
-            "outtmpl": str(out_dir / "%(title)s.%(ext)s"),
+            "outtmpl": "%(title)s.%(ext)s",
             "format": "best[ext=mp4]/best",
             "noplaylist": True,
             "quiet": True,
             "no_warnings": True,
         }
 
+    # Fetch segmented (DASH/HLS) formats over parallel connections and in
+    # large ranged chunks; YouTube throttles single long-lived connections.
+    ydl_opts.update(_YTDLP_TRANSFER_OPTS)
+    aria2c = shutil.which("aria2c")
+    if aria2c and progress is None:
+        # aria2c splits even progressive downloads across connections, but
+        # yt-dlp cannot report byte progress through it, so only use it headless
+        ydl_opts["external_downloader"] = {"default": aria2c}
+        ydl_opts["external_downloader_args"] = {"aria2c": ["-x16", "-s16", "-k1M"]}
+
     if progress is not None:
+        last_emit = 0.0
+
         def hook(d):
+            nonlocal last_emit
             try:
                 if d.get('status') == 'downloading':
                     total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
                     downloaded = d.get('downloaded_bytes') or 0
+                    # Throttle to ~10 updates/s; always report completion
+                    now = time.monotonic()
+                    if now - last_emit < _PROGRESS_INTERVAL and not (total and downloaded >= total):
+                        return
+                    last_emit = now
                     pct = (downloaded / total * 100.0) if total else None
                     spd = d.get('speed')
                     eta = d.get('eta')
@@ -150,10 +333,12 @@ def _download_with_ytdlp(url: str, out_dir: Path, progress: Optional[Callable[[D
                     })
             except Exception:
                 pass
-        ydl_opts["progress_hooks"] = [hook]
+    else:
+        hook = None
 
     try:
-        with YoutubeDL(ydl_opts) as ydl:
+        with _borrow_ydl(ydl_opts, out_dir) as (ydl, hook_slot):
+            hook_slot[0] = hook
             info = ydl.extract_info(url, download=True)
             # Try to determine the final downloaded file path robustly
             path_str = None
@@ -164,21 +349,108 @@ def _download_with_ytdlp(url: str, out_dir: Path, progress: Optional[Callable[[D
                 path_str = info.get("filepath") or info.get("_filename")
             if not path_str:
                 path_str = ydl.prepare_filename(info)
-            
-            result_path = Path(path_str)
-            logger.info(f"yt-dlp download successful: {result_path}")
-            return result_path
+        
+        result_path = Path(path_str)
+        logger.info(f"yt-dlp download successful: {result_path}")
+        return result_path
     except Exception as e:
         logger.error(f"yt-dlp download failed: {e}")
         error_tracker.log_error(e, context="yt-dlp download", module="download", function="_download_with_ytdlp")
         raise
 
 
+def _move_file(src: Path, dst: Path) -> None:
+    """
+    Move src to dst with a rename when possible.
+
+    A same-filesystem rename is a metadata-only operation; across devices,
+    shutil.copyfile lets the kernel copy the data (sendfile) before src
+    is removed.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+        src.unlink(missing_ok=True)
+
+
+def _race_downloaders(url: str, out_dir: Path, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Path:
+    """
+    Run pytube and yt-dlp concurrently and keep whichever succeeds first.
+
+    Each downloader writes into its own scratch directory under the system
+    temp dir so they cannot clobber each other or leave partial files in
+    out_dir; the winning file is moved into out_dir. The losing download
+    cannot be interrupted, so it is left to finish in the background and
+    its scratch directory is removed when it does.
+
+    Only one downloader reports progress: the first to emit an update leads
+    until it fails, and nothing is reported once the race is decided.
+    """
+    scratch = {
+        name: Path(tempfile.mkdtemp(prefix=f"freetube-{name}-"))
+        for name in ("pytube", "ytdlp")
+    }
+    leader_lock = threading.Lock()
+    leader: List[Optional[str]] = [None]
+
+    def _progress_for(name: str) -> Optional[Callable[[Dict[str, Any]], None]]:
+        if progress is None:
+            return None
+
+        def report(payload: Dict[str, Any]) -> None:
+            with leader_lock:
+                if leader[0] is None:
+                    leader[0] = name
+                elif leader[0] != name:
+                    return
+            progress(payload)
+
+        return report
+
+    ex = ThreadPoolExecutor(max_workers=2)
+    futures = {
+        ex.submit(_download_with_pytube, url, scratch["pytube"], _progress_for("pytube")): "pytube",
+        ex.submit(_download_with_ytdlp, url, scratch["ytdlp"], _progress_for("ytdlp")): "ytdlp",
+    }
+    ex.shutdown(wait=False)
+
+    last_error: Optional[Exception] = None
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = futures[fut]
+                try:
+                    p = fut.result()
+                except Exception as e:
+                    logger.debug(f"{name} lost the download race: {e}")
+                    last_error = e
+                    p = None
+                if p is not None and p.exists():
+                    final = out_dir / p.name
+                    _move_file(p, final)
+                    logger.info(f"{name} won the download race")
+                    return final
+                # Hand progress reporting to the downloader still running
+                with leader_lock:
+                    if leader[0] == name:
+                        leader[0] = None
+        raise RuntimeError(f"Both downloaders failed. Last error: {last_error}")
+    finally:
+        with leader_lock:
+            leader[0] = ""  # race decided: silence the loser
+        for fut, name in futures.items():
+            fut.add_done_callback(lambda _f, d=scratch[name]: shutil.rmtree(d, ignore_errors=True))
+
+
 @retry(max_attempts=2, delay=2.0, exceptions=(RuntimeError, ConnectionError))
 def download_youtube(url: str, output_dir: Path | None = None, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Path:
     """
     Download a YouTube video as MP4 and return the file path.
     Tries pytube first; on failure falls back to yt-dlp (more robust).
+    With FREETUBE_RACE_DOWNLOADERS=1, runs both at once and keeps the first success.
     """
     logger.info(f"Starting download for URL: {url}")
     out_dir = Path(output_dir) if output_dir else VIDEOS
@@ -187,6 +459,17 @@ def download_youtube(url: str, output_dir: Path | None = None, progress: Optiona
     norm = normalize_yt_url(url)
     logger.debug(f"Normalized URL: {norm}")
     
+    if os.environ.get("FREETUBE_RACE_DOWNLOADERS") == "1":
+        try:
+            result = _race_downloaders(norm, out_dir, progress)
+            logger.info(f"Download complete (race): {result}")
+            return result
+        except Exception as e:
+            error_msg = f"Failed to download video. Last error: {e}"
+            logger.error(error_msg)
+            error_tracker.log_error(e, context="Download failed with both racing downloaders", module="download", function="download_youtube")
+            raise RuntimeError(error_msg)
+    
     # Try pytube
     try:
         p = _download_with_pytube(norm, out_dir, progress)
@@ -206,3 +489,51 @@ def download_youtube(url: str, output_dir: Path | None = None, progress: Optiona
         logger.error(error_msg)
         error_tracker.log_error(e, context="Download failed with both pytube and yt-dlp", module="download", function="download_youtube")
         raise RuntimeError(error_msg)
+
+
+def download_youtube_many(
+    urls: List[str],
+    output_dir: Path | None = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    max_workers: int = 4,
+) -> List[Optional[Path]]:
+    """
+    Download several YouTube videos concurrently.
+
+    Downloads are network-bound, so a small thread pool overlaps them; more
+    than 3-4 workers tends to trigger YouTube rate limiting.
+
+    Args:
+        urls: Video URLs to download
+        output_dir: Optional output directory (defaults to paths.VIDEOS)
+        progress: Optional callback; each payload gains a "url" key so
+            updates from concurrent downloads can be told apart
+        max_workers: Maximum concurrent downloads
+
+    Returns:
+        Downloaded file paths in the same order as urls; None for failures
+    """
+    results: List[Optional[Path]] = [None] * len(urls)
+    if not urls:
+        return results
+
+    def _progress_for(u: str) -> Optional[Callable[[Dict[str, Any]], None]]:
+        if progress is None:
+            return None
+        return lambda payload: progress({"url": u, **payload})
+
+    logger.info(f"Starting batch download of {len(urls)} URLs (max_workers={max_workers})")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as ex:
+        futures = {
+            ex.submit(download_youtube, u, output_dir, _progress_for(u)): i
+            for i, u in enumerate(urls)
+        }
+        for fut in as_completed(futures):
+            i = futures[fut]
+            try:
+                results[i] = fut.result()
+            except Exception as e:
+                logger.error(f"Batch download failed for {urls[i]}: {e}")
+
+    logger.info(f"Batch download complete: {sum(p is not None for p in results)}/{len(urls)} succeeded")
+    return results
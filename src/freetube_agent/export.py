@@ -1,44 +1,66 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
 
 from .transcribe import Transcript, Segment
 from .paths import TRANSCRIPTS
 
 
+def _split_ms(t: float) -> tuple:
+    """Split seconds into (h, m, s, ms) with one rounding and integer divmods."""
+    s, ms = divmod(int(t * 1000 + 0.5), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return h, m, s, ms
+
+
 def _fmt_timestamp_srt(t: float) -> str:
-    h = int(t // 3600)
-    m = int((t % 3600) // 60)
-    s = int(t % 60)
-    ms = int(round((t - int(t)) * 1000))
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+    return "%02d:%02d:%02d,%03d" % _split_ms(t)
 
 
 def _fmt_timestamp_vtt(t: float) -> str:
-    h = int(t // 3600)
-    m = int((t % 3600) // 60)
-    s = int(t % 60)
-    ms = int(round((t - int(t)) * 1000))
-    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+    return "%02d:%02d:%02d.%03d" % _split_ms(t)
+
+
+_SRT_CUE = "{i}\n{start} --> {end}\n{text}\n\n"
+_VTT_CUE = "{start} --> {end}\n{text}\n\n"
+
+
+def _srt_records(segments: list[Segment]):
+    render = _SRT_CUE.format_map
+    for i, seg in enumerate(segments, 1):
+        text = seg.text.strip()
+        if not text:
+            continue
+        yield render({
+            "i": i,
+            "start": _fmt_timestamp_srt(seg.start),
+            "end": _fmt_timestamp_srt(seg.end),
+            "text": text,
+        })
+
+
+def _vtt_records(segments: list[Segment]):
+    render = _VTT_CUE.format_map
+    for seg in segments:
+        text = seg.text.strip()
+        if not text:
+            continue
+        yield render({
+            "start": _fmt_timestamp_vtt(seg.start),
+            "end": _fmt_timestamp_vtt(seg.end),
+            "text": text,
+        })
 
 
 def save_srt(t: Transcript, video_stem: str, output_dir: Path | None = None) -> Path:
     out_dir = Path(output_dir) if output_dir else TRANSCRIPTS
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{video_stem}.srt"
-    lines = []
-    for i, seg in enumerate(t.segments, 1):
-        start = _fmt_timestamp_srt(seg.start)
-        end = _fmt_timestamp_srt(seg.end)
-        text = seg.text.strip()
-        if not text:
-            continue
-        lines.append(str(i))
-        lines.append(f"{start} --> {end}")
-        lines.append(text)
-        lines.append("")
-    path.write_text("\n".join(lines), encoding="utf-8")
+    # Stream cues from a generator into a large buffered handle; nothing is
+    # held per segment
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(_srt_records(t.segments))
     return path
 
 
@@ -46,16 +68,7 @@ def save_vtt(t: Transcript, video_stem: str, output_dir: Path | None = None) ->
     out_dir = Path(output_dir) if output_dir else TRANSCRIPTS
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{video_stem}.vtt"
-    lines = ["WEBVTT", ""]
-    for seg in t.segments:
-        start = _fmt_timestamp_vtt(seg.start)
-        end = _fmt_timestamp_vtt(seg.end)
-        text = seg.text.strip()
-        if not text:
-            continue
-        lines.append(f"{start} --> {end}")
-        lines.append(text)
-        lines.append("")
-    path.write_text("\n".join(lines), encoding="utf-8")
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("WEBVTT\n\n")
+        f.writelines(_vtt_records(t.segments))
     return path
-
@@ -5,19 +5,44 @@ Exports transcripts and summaries to multiple formats: PDF, Word, Markdown, JSON
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, lru_cache
+from itertools import islice
+from types import SimpleNamespace
+import io
+import os
+import re
+
+from html import escape
 
 from .transcribe import Transcript
 from .paths import TRANSCRIPTS
+from .jsonio import dump_json
+
+
+# Whitespace-delimited word, matching str.split() for word counts
+_WORD_RE = re.compile(r"\S+")
+
+# One transcript paragraph in the blog post HTML
+_BLOG_SEGMENT_HTML = "<p><span class='timestamp'>[{}]</span> {}</p>"
+
+
+def _escape_all(texts: List[str]) -> List[str]:
+    """HTML-escape many strings with a single escape() call over a joined buffer."""
+    sep = "\x01"
+    if any(sep in t for t in texts):
+        return [escape(t) for t in texts]
+    return escape(sep.join(texts)).split(sep)
 
 
 def export_to_markdown(
     transcript: Transcript,
     video_title: str,
     summary_data: Optional[Dict[str, Any]] = None,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    generated_at: Optional[datetime] = None
 ) -> Path:
     """
     Export transcript and optional summary to Markdown format.
@@ -27,66 +52,146 @@ def export_to_markdown(
         video_title: Title of the video
         summary_data: Optional summary data from summarize module
         output_path: Optional custom output path
+        generated_at: Timestamp to stamp the export with (defaults to now)
     
     Returns:
         Path to exported markdown file
     """
     if output_path is None:
         output_path = TRANSCRIPTS / f"{video_title}_export.md"
+    if generated_at is None:
+        generated_at = datetime.now()
     
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
     
     # Header
-    lines.append(f"# {video_title}\n")
-    lines.append(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
-    lines.append("---\n")
+    w(f"# {video_title}\n\n")
+    w(f"*Generated on: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+    w("---\n\n")
     
     # Summary section if available
     if summary_data:
-        lines.append("## 📝 Summary\n")
+        w("## 📝 Summary\n\n")
         
         if summary_data.get("tldr", {}).get("success"):
-            lines.append("### TL;DR\n")
-            lines.append(f"> {summary_data['tldr']['tldr']}\n")
+            w("### TL;DR\n\n")
+            w(f"> {summary_data['tldr']['tldr']}\n\n")
         
         if summary_data.get("key_points", {}).get("success"):
-            lines.append("### Key Points\n")
+            w("### Key Points\n\n")
             for point in summary_data["key_points"]["key_points"]:
-                lines.append(f"- {point}\n")
-            lines.append("\n")
+                w(f"- {point}\n\n")
+            w("\n\n")
         
         if summary_data.get("topics", {}).get("success"):
-            lines.append("### Topics Covered\n")
+            w("### Topics Covered\n\n")
             for topic in summary_data["topics"]["topics"]:
-                lines.append(f"**{topic['name']}**: {topic['description']}\n")
-            lines.append("\n")
+                w(f"**{topic['name']}**: {topic['description']}\n\n")
+            w("\n\n")
         
         if summary_data.get("summary", {}).get("success"):
-            lines.append("### Detailed Summary\n")
-            lines.append(f"{summary_data['summary']['summary']}\n\n")
+            w("### Detailed Summary\n\n")
+            w(f"{summary_data['summary']['summary']}\n\n\n")
         
-        lines.append("---\n")
+        w("---\n\n")
     
     # Full Transcript
-    lines.append("## 📄 Full Transcript\n")
+    w("## 📄 Full Transcript\n\n")
     
     if transcript.segments:
+        fmt_ts = format_timestamp
         for segment in transcript.segments:
-            timestamp = format_timestamp(segment.start)
-            lines.append(f"**[{timestamp}]** {segment.text}\n")
+            w("**[")
+            w(fmt_ts(segment.start))
+            w("]** ")
+            w(segment.text)
+            w("\n\n")
     else:
-        lines.append(transcript.text)
+        w(transcript.text)
+        w("\n")
     
     # Write to file
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    output_path.write_text(buf.getvalue(), encoding="utf-8")
     return output_path
 
 
+@cache
+def _reportlab() -> SimpleNamespace:
+    """Import reportlab once and keep the pieces export_to_pdf needs."""
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+        from reportlab.lib.enums import TA_CENTER
+    except ImportError:
+        raise RuntimeError("reportlab not installed. Run: pip install reportlab")
+    
+    return SimpleNamespace(
+        letter=letter,
+        styles=getSampleStyleSheet(),
+        ParagraphStyle=ParagraphStyle,
+        inch=inch,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        PageBreak=PageBreak,
+        TA_CENTER=TA_CENTER,
+    )
+
+
+@cache
+def _docx() -> SimpleNamespace:
+    """Import python-docx once and keep the pieces export_to_word needs."""
+    try:
+        from docx import Document
+        from docx.shared import Pt, RGBColor
+        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    except ImportError:
+        raise RuntimeError("python-docx not installed. Run: pip install python-docx")
+    
+    return SimpleNamespace(
+        Document=Document,
+        Pt=Pt,
+        RGBColor=RGBColor,
+        WD_PARAGRAPH_ALIGNMENT=WD_PARAGRAPH_ALIGNMENT,
+    )
+
+
+class _LazyStory(list):
+    """
+    Flowable list for reportlab that pulls its tail from an iterator in batches.
+    
+    doc.build() consumes the story from the front with len()/[0]/del, so
+    topping the list up inside __len__ keeps at most about one batch of
+    pending flowables alive at a time. That consumption order is reportlab
+    internals, pinned by tests/test_export_advanced.py.
+    """
+    
+    def __init__(self, head, tail, batch_size: int = 500):
+        super().__init__(head)
+        self._tail = iter(tail)
+        self._batch_size = batch_size
+    
+    def __len__(self) -> int:
+        n = super().__len__()
+        if n < self._batch_size and self._tail is not None:
+            more = list(islice(self._tail, self._batch_size))
+            if more:
+                self.extend(more)
+            else:
+                self._tail = None
+            n = super().__len__()
+        return n
+
+
 def export_to_pdf(
     transcript: Transcript,
     video_title: str,
     summary_data: Optional[Dict[str, Any]] = None,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    generated_at: Optional[datetime] = None
 ) -> Path:
     """
     Export transcript and optional summary to PDF format.
@@ -96,38 +201,36 @@ def export_to_pdf(
         video_title: Title of the video
         summary_data: Optional summary data
         output_path: Optional custom output path
+        generated_at: Timestamp to stamp the export with (defaults to now)
     
     Returns:
         Path to exported PDF file
     """
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER
-    except ImportError:
-        raise RuntimeError("reportlab not installed. Run: pip install reportlab")
+    rl = _reportlab()
+    Paragraph, Spacer = rl.Paragraph, rl.Spacer
+    inch = rl.inch
     
     if output_path is None:
         output_path = TRANSCRIPTS / f"{video_title}_export.pdf"
+    if generated_at is None:
+        generated_at = datetime.now()
     
     # Create PDF document
-    doc = SimpleDocTemplate(str(output_path), pagesize=letter)
+    doc = rl.SimpleDocTemplate(os.fspath(output_path), pagesize=rl.letter)
     story = []
-    styles = getSampleStyleSheet()
+    styles = rl.styles
     
     # Custom styles
-    title_style = ParagraphStyle(
+    title_style = rl.ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=24,
         textColor='#FF0000',
         spaceAfter=12,
-        alignment=TA_CENTER
+        alignment=rl.TA_CENTER
     )
     
-    heading_style = ParagraphStyle(
+    heading_style = rl.ParagraphStyle(
         'CustomHeading',
         parent=styles['Heading2'],
         fontSize=16,
@@ -139,7 +242,7 @@ def export_to_pdf(
     # Title
     story.append(Paragraph(video_title, title_style))
     story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
+    story.append(Paragraph(f"Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
     story.append(Spacer(1, 0.3*inch))
     
     # Summary section if available
@@ -163,18 +266,25 @@ def export_to_pdf(
                 story.append(Paragraph(f"<b>{topic['name']}:</b> {topic['description']}", styles['Normal']))
             story.append(Spacer(1, 0.2*inch))
         
-        story.append(PageBreak())
+        story.append(rl.PageBreak())
     
     # Full Transcript
     story.append(Paragraph("Full Transcript", heading_style))
     story.append(Spacer(1, 0.1*inch))
     
     if transcript.segments:
-        for segment in transcript.segments:
-            timestamp = format_timestamp(segment.start)
-            text = f"<b>[{timestamp}]</b> {segment.text}"
-            story.append(Paragraph(text, styles['Normal']))
-            story.append(Spacer(1, 0.05*inch))
+        normal = styles['Normal']
+        
+        def segment_flowables():
+            fmt_ts = format_timestamp
+            for segment in transcript.segments:
+                timestamp = fmt_ts(segment.start)
+                yield Paragraph(f"<b>[{timestamp}]</b> {segment.text}", normal)
+                yield Spacer(1, 0.05*inch)
+        
+        # Paragraphs are created in batches as reportlab lays pages out,
+        # rather than holding one per segment in memory up front
+        story = _LazyStory(story, segment_flowables())
     else:
         story.append(Paragraph(transcript.text, styles['Normal']))
     
@@ -187,7 +297,8 @@ def export_to_word(
     transcript: Transcript,
     video_title: str,
     summary_data: Optional[Dict[str, Any]] = None,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    generated_at: Optional[datetime] = None
 ) -> Path:
     """
     Export transcript and optional summary to Word DOCX format.
@@ -197,33 +308,32 @@ def export_to_word(
         video_title: Title of the video
         summary_data: Optional summary data
         output_path: Optional custom output path
+        generated_at: Timestamp to stamp the export with (defaults to now)
     
     Returns:
         Path to exported DOCX file
     """
-    try:
-        from docx import Document
-        from docx.shared import Pt, RGBColor, Inches
-        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-    except ImportError:
-        raise RuntimeError("python-docx not installed. Run: pip install python-docx")
+    dx = _docx()
+    RGBColor = dx.RGBColor
     
     if output_path is None:
         output_path = TRANSCRIPTS / f"{video_title}_export.docx"
+    if generated_at is None:
+        generated_at = datetime.now()
     
-    doc = Document()
+    doc = dx.Document()
     
     # Title
     title = doc.add_heading(video_title, 0)
-    title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+    title.alignment = dx.WD_PARAGRAPH_ALIGNMENT.CENTER
     title_run = title.runs[0]
     title_run.font.color.rgb = RGBColor(255, 0, 0)  # YouTube red
     
     # Metadata
-    meta = doc.add_paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    meta.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+    meta = doc.add_paragraph(f"Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    meta.alignment = dx.WD_PARAGRAPH_ALIGNMENT.CENTER
     meta_run = meta.runs[0]
-    meta_run.font.size = Pt(10)
+    meta_run.font.size = dx.Pt(10)
     meta_run.font.color.rgb = RGBColor(128, 128, 128)
     
     doc.add_paragraph()
@@ -262,9 +372,11 @@ def export_to_word(
     doc.add_heading("Full Transcript", 1)
     
     if transcript.segments:
+        fmt_ts = format_timestamp
+        add_paragraph = doc.add_paragraph
         for segment in transcript.segments:
-            timestamp = format_timestamp(segment.start)
-            p = doc.add_paragraph()
+            timestamp = fmt_ts(segment.start)
+            p = add_paragraph()
             timestamp_run = p.add_run(f"[{timestamp}] ")
             timestamp_run.bold = True
             timestamp_run.font.color.rgb = RGBColor(62, 166, 255)  # YouTube blue
@@ -273,7 +385,7 @@ def export_to_word(
         doc.add_paragraph(transcript.text)
     
     # Save
-    doc.save(str(output_path))
+    doc.save(os.fspath(output_path))
     return output_path
 
 
@@ -281,7 +393,8 @@ def export_to_json(
     transcript: Transcript,
     video_title: str,
     summary_data: Optional[Dict[str, Any]] = None,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    generated_at: Optional[datetime] = None
 ) -> Path:
     """
     Export transcript and optional summary to JSON format.
@@ -291,17 +404,22 @@ def export_to_json(
         video_title: Title of the video
         summary_data: Optional summary data
         output_path: Optional custom output path
+        generated_at: Timestamp to stamp the export with (defaults to now)
     
     Returns:
         Path to exported JSON file
     """
     if output_path is None:
         output_path = TRANSCRIPTS / f"{video_title}_export.json"
+    if generated_at is None:
+        generated_at = datetime.now()
+    
+    segs = transcript.segments or []
     
     # Build JSON structure
     data = {
         "title": video_title,
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": generated_at.isoformat(),
         "transcript": {
             "text": transcript.text,
             "segments": [
@@ -311,10 +429,10 @@ def export_to_json(
                     "duration": seg.end - seg.start,
                     "text": seg.text
                 }
-                for seg in transcript.segments
-            ] if transcript.segments else [],
-            "word_count": len(transcript.text.split()),
-            "duration": transcript.segments[-1].end if transcript.segments else 0
+                for seg in segs
+            ],
+            "word_count": sum(1 for _ in _WORD_RE.finditer(transcript.text)),
+            "duration": segs[-1].end if segs else 0
         }
     }
     
@@ -322,9 +440,8 @@ def export_to_json(
     if summary_data:
         data["summary"] = summary_data
     
-    # Write JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Write JSON (orjson when installed)
+    dump_json(data, output_path)
     
     return output_path
 
@@ -334,7 +451,8 @@ def export_blog_post(
     video_title: str,
     summary_data: Optional[Dict[str, Any]] = None,
     output_path: Optional[Path] = None,
-    include_metadata: bool = True
+    include_metadata: bool = True,
+    generated_at: Optional[datetime] = None
 ) -> Path:
     """
     Export as a blog post format with HTML.
@@ -345,20 +463,24 @@ def export_blog_post(
         summary_data: Optional summary data
         output_path: Optional custom output path
         include_metadata: Include SEO metadata
+        generated_at: Timestamp to stamp the export with (defaults to now)
     
     Returns:
         Path to exported HTML file
     """
     if output_path is None:
         output_path = TRANSCRIPTS / f"{video_title}_blog.html"
+    if generated_at is None:
+        generated_at = datetime.now()
     
+    title = escape(video_title)
     html = []
     
     if include_metadata:
         html.append("<!DOCTYPE html>")
         html.append("<html lang='en'>")
         html.append("<head>")
-        html.append(f"<title>{video_title}</title>")
+        html.append(f"<title>{title}</title>")
         html.append("<meta charset='UTF-8'>")
         html.append("<meta name='viewport' content='width=device-width, initial-scale=1.0'>")
         html.append("<style>")
@@ -374,14 +496,14 @@ def export_blog_post(
         html.append("<body>")
     
     # Title
-    html.append(f"<h1>{video_title}</h1>")
-    html.append(f"<p><em>Published: {datetime.now().strftime('%B %d, %Y')}</em></p>")
+    html.append(f"<h1>{title}</h1>")
+    html.append(f"<p><em>Published: {generated_at.strftime('%B %d, %Y')}</em></p>")
     
     # Summary section
     if summary_data:
         if summary_data.get("tldr", {}).get("success"):
             html.append("<div class='tldr'>")
-            html.append(f"<strong>TL;DR:</strong> {summary_data['tldr']['tldr']}")
+            html.append(f"<strong>TL;DR:</strong> {escape(summary_data['tldr']['tldr'])}")
             html.append("</div>")
         
         if summary_data.get("key_points", {}).get("success"):
@@ -389,23 +511,27 @@ def export_blog_post(
             html.append("<h2>Key Takeaways</h2>")
             html.append("<ul>")
             for point in summary_data["key_points"]["key_points"]:
-                html.append(f"<li>{point}</li>")
+                html.append(f"<li>{escape(point)}</li>")
             html.append("</ul>")
             html.append("</div>")
         
         if summary_data.get("summary", {}).get("success"):
             html.append("<h2>Overview</h2>")
-            html.append(f"<p>{summary_data['summary']['summary']}</p>")
+            html.append(f"<p>{escape(summary_data['summary']['summary'])}</p>")
     
     # Transcript
     html.append("<h2>Full Transcript</h2>")
     
     if transcript.segments:
-        for segment in transcript.segments:
-            timestamp = format_timestamp(segment.start)
-            html.append(f"<p><span class='timestamp'>[{timestamp}]</span> {segment.text}</p>")
+        fmt = _BLOG_SEGMENT_HTML.format
+        fmt_ts = format_timestamp
+        texts = _escape_all([segment.text for segment in transcript.segments])
+        html.append("\n".join(
+            fmt(fmt_ts(segment.start), text)
+            for segment, text in zip(transcript.segments, texts)
+        ))
     else:
-        html.append(f"<p>{transcript.text}</p>")
+        html.append(f"<p>{escape(transcript.text)}</p>")
     
     if include_metadata:
         html.append("</body>")
@@ -416,12 +542,92 @@ def export_blog_post(
     return output_path
 
 
+# Exporter and default filename suffix for each format accepted by export_all
+_EXPORTERS = {
+    "markdown": (export_to_markdown, "_export.md"),
+    "pdf": (export_to_pdf, "_export.pdf"),
+    "word": (export_to_word, "_export.docx"),
+    "json": (export_to_json, "_export.json"),
+    "blog": (export_blog_post, "_blog.html"),
+}
+
+
+def export_all(
+    transcript: Transcript,
+    video_title: str,
+    summary_data: Optional[Dict[str, Any]] = None,
+    formats: Optional[List[str]] = None,
+    output_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Export to several formats at once, running the exporters concurrently.
+    
+    The exporters write independent files, and reportlab/python-docx spend
+    much of their time in C code (compression, zip/file I/O) that releases
+    the GIL, so the slow PDF/DOCX builds overlap with each other and with
+    the Markdown/JSON/HTML writes.
+    
+    Args:
+        transcript: Transcript object
+        video_title: Title of the video
+        summary_data: Optional summary data
+        formats: Formats to export - any of "markdown", "pdf", "word", "json", "blog" (defaults to all)
+        output_dir: Optional output directory (defaults to paths.TRANSCRIPTS)
+    
+    Returns:
+        Dict with results: {paths: {format: Path}, errors: {format: str}}
+    """
+    if formats is None:
+        formats = list(_EXPORTERS)
+    unknown = [fmt for fmt in formats if fmt not in _EXPORTERS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(unknown)}")
+    
+    out_dir = Path(output_dir) if output_dir else TRANSCRIPTS
+    out_dir.mkdir(parents=True, exist_ok=True)
+    
+    # One timestamp for the whole batch so every format agrees
+    generated_at = datetime.now()
+    
+    def run(fmt: str) -> Path:
+        exporter, suffix = _EXPORTERS[fmt]
+        return exporter(
+            transcript, video_title, summary_data, out_dir / f"{video_title}{suffix}",
+            generated_at=generated_at,
+        )
+    
+    results = {"paths": {}, "errors": {}}
+    
+    if len(formats) == 1:
+        fmt = formats[0]
+        try:
+            results["paths"][fmt] = run(fmt)
+        except Exception as e:
+            results["errors"][fmt] = str(e)
+        return results
+    
+    with ThreadPoolExecutor(max_workers=len(formats)) as ex:
+        futures = {ex.submit(run, fmt): fmt for fmt in formats}
+        for fut in as_completed(futures):
+            fmt = futures[fut]
+            try:
+                results["paths"][fmt] = fut.result()
+            except Exception as e:
+                results["errors"][fmt] = str(e)
+    
+    return results
+
+
 def format_timestamp(seconds: float) -> str:
     """Format seconds as MM:SS or HH:MM:SS"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(total: int) -> str:
+    minutes, secs = divmod(total, 60)
+    hours, minutes = divmod(minutes, 60)
     
     if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    return f"{minutes:02d}:{secs:02d}"
+        return "%02d:%02d:%02d" % (hours, minutes, secs)
+    return "%02d:%02d" % (minutes, secs)
@@ -0,0 +1,74 @@
+"""
+JSON I/O Helpers
+Reads and writes JSON with orjson when available, falling back to the stdlib module.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def dump_json(data: Any, path: Path | str) -> None:
+    """
+    Write data to path as indented UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable object
+        path: Destination file path
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_json(path: Path | str) -> Any:
+    """
+    Read and parse a UTF-8 JSON file.
+
+    Args:
+        path: Source file path
+
+    Returns:
+        Parsed JSON value
+    """
+    with open(path, 'rb') as f:
+        return load_json_bytes(f.read())
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """
+    Parse UTF-8 encoded JSON.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_line(data: Any) -> bytes:
+    """
+    Encode data as one compact UTF-8 JSON line (newline-terminated), for append-only logs.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        Encoded bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data) + '\n').encode('utf-8')
@@ -7,55 +7,147 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import mmap
+import os
+import re
 
-from .paths import VIDEOS, AUDIO, TRANSCRIPTS, DATA
+from .paths import VIDEOS, AUDIO, TRANSCRIPTS, METADATA
+from .library_index import candidate_stems
+from .jsonio import dump_json, load_json
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    """os.stat() the path, or None if it doesn't exist"""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _scan_dir(directory: Path, suffix: str) -> Dict[str, os.stat_result]:
+    """Map stem -> stat for every file ending in suffix, from one os.scandir pass"""
+    out = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                # Same matches as glob("*" + suffix): no hidden files
+                if entry.name.endswith(suffix) and not entry.name.startswith("."):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    out[entry.name[:-len(suffix)]] = st
+    except FileNotFoundError:
+        pass
+    return out
+
+
+# metadata path -> (mtime_ns, parsed metadata); reused while the file is unchanged
+_METADATA_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _copy_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy deep enough that in-place tag edits don't leak into the cache"""
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in metadata.items()}
+
+
+def _read_metadata(path: Path, st: Optional[os.stat_result]) -> Dict[str, Any]:
+    """Parsed metadata for path (shared cache entry - copy before mutating)"""
+    key = str(path)
+    if st is None:
+        _METADATA_CACHE.pop(key, None)
+        return {}
+    
+    cached = _METADATA_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
+    try:
+        metadata = load_json(path)
+    except Exception:
+        return {}
+    _METADATA_CACHE[key] = (st.st_mtime_ns, metadata)
+    return metadata
+
+
+def _scan_stems(directory: Path, suffix: str) -> set:
+    """Stems of the files ending in suffix, from names alone (no stat calls)"""
+    try:
+        with os.scandir(directory) as it:
+            return {
+                entry.name[:-len(suffix)] for entry in it
+                if entry.name.endswith(suffix) and not entry.name.startswith(".")
+            }
+    except FileNotFoundError:
+        return set()
 
 
 class LibraryItem:
     """Represents a video item in the library"""
     
-    def __init__(self, stem: str):
+    def __init__(self, stem: str, stats: Optional[Dict[str, os.stat_result]] = None):
         self.stem = stem
         self.video_path = VIDEOS / f"{stem}.mp4"
         self.audio_path = AUDIO / f"{stem}.wav"
         self.transcript_path = TRANSCRIPTS / f"{stem}.txt"
-        self.metadata_path = DATA / "metadata" / f"{stem}.json"
+        self.metadata_path = METADATA / f"{stem}.json"
+        
+        # One stat per file, shared by every size/date/presence property;
+        # get_all_library_items passes in the results of its directory scan
+        if stats is None:
+            self.invalidate()
+        else:
+            self._stat_video = stats.get("video")
+            self._stat_audio = stats.get("audio")
+            self._stat_transcript = stats.get("transcript")
         
         # Load metadata if exists
-        self.metadata = self._load_metadata()
-    
-    def _load_metadata(self) -> Dict[str, Any]:
-        """Load metadata from JSON file"""
-        if self.metadata_path.exists():
-            try:
-                with open(self.metadata_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        self.metadata = self._load_metadata(stats.get("metadata", False) if stats is not None else False)
+    
+    def invalidate(self) -> None:
+        """Re-stat the item's files after they were created, changed or deleted"""
+        self._stat_video = _stat(self.video_path)
+        self._stat_audio = _stat(self.audio_path)
+        self._stat_transcript = _stat(self.transcript_path)
+    
+    def _stats(self) -> List[os.stat_result]:
+        return [st for st in (self._stat_video, self._stat_audio, self._stat_transcript) if st is not None]
+    
+    def _load_metadata(self, st: Optional[os.stat_result] | bool = False) -> Dict[str, Any]:
+        """
+        Load metadata from JSON file, reusing the parsed copy while its mtime is unchanged.
+        
+        Args:
+            st: Stat of the metadata file from a directory scan (None if it doesn't
+                exist); False to stat it here
+        """
+        if st is False:
+            st = _stat(self.metadata_path)
+        return _copy_metadata(_read_metadata(self.metadata_path, st))
     
     def save_metadata(self) -> bool:
         """Save metadata to JSON file"""
         try:
-            self.metadata_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, indent=2, ensure_ascii=False)
+            dump_json(self.metadata, self.metadata_path)
+            st = _stat(self.metadata_path)
+            if st is not None:
+                _METADATA_CACHE[str(self.metadata_path)] = (st.st_mtime_ns, _copy_metadata(self.metadata))
             return True
         except Exception:
             return False
     
     @property
     def has_video(self) -> bool:
-        return self.video_path.exists()
+        return self._stat_video is not None
     
     @property
     def has_audio(self) -> bool:
-        return self.audio_path.exists()
+        return self._stat_audio is not None
     
     @property
     def has_transcript(self) -> bool:
-        return self.transcript_path.exists()
+        return self._stat_transcript is not None
     
     @property
     def is_complete(self) -> bool:
@@ -63,49 +155,49 @@ class LibraryItem:
     
     @property
     def video_size_mb(self) -> float:
-        if self.has_video:
-            return self.video_path.stat().st_size / (1024 * 1024)
+        if self._stat_video is not None:
+            return self._stat_video.st_size / (1024 * 1024)
         return 0.0
     
     @property
     def audio_size_mb(self) -> float:
-        if self.has_audio:
-            return self.audio_path.stat().st_size / (1024 * 1024)
+        if self._stat_audio is not None:
+            return self._stat_audio.st_size / (1024 * 1024)
         return 0.0
     
     @property
     def transcript_size_kb(self) -> float:
-        if self.has_transcript:
-            return self.transcript_path.stat().st_size / 1024
+        if self._stat_transcript is not None:
+            return self._stat_transcript.st_size / 1024
         return 0.0
     
     @property
     def total_size_mb(self) -> float:
         return self.video_size_mb + self.audio_size_mb + (self.transcript_size_kb / 1024)
     
+    @property
+    def _ctime_raw(self) -> Optional[float]:
+        """Oldest st_ctime of the item's files, as epoch seconds"""
+        stats = self._stats()
+        return min(st.st_ctime for st in stats) if stats else None
+    
+    @property
+    def _mtime_raw(self) -> Optional[float]:
+        """Newest st_mtime of the item's files, as epoch seconds"""
+        stats = self._stats()
+        return max(st.st_mtime for st in stats) if stats else None
+    
     @property
     def created_date(self) -> Optional[datetime]:
         """Get creation date from the oldest file"""
-        dates = []
-        if self.has_video:
-            dates.append(datetime.fromtimestamp(self.video_path.stat().st_ctime))
-        if self.has_audio:
-            dates.append(datetime.fromtimestamp(self.audio_path.stat().st_ctime))
-        if self.has_transcript:
-            dates.append(datetime.fromtimestamp(self.transcript_path.stat().st_ctime))
-        return min(dates) if dates else None
+        ts = self._ctime_raw
+        return datetime.fromtimestamp(ts) if ts is not None else None
     
     @property
     def modified_date(self) -> Optional[datetime]:
         """Get last modified date from the newest file"""
-        dates = []
-        if self.has_video:
-            dates.append(datetime.fromtimestamp(self.video_path.stat().st_mtime))
-        if self.has_audio:
-            dates.append(datetime.fromtimestamp(self.audio_path.stat().st_mtime))
-        if self.has_transcript:
-            dates.append(datetime.fromtimestamp(self.transcript_path.stat().st_mtime))
-        return max(dates) if dates else None
+        ts = self._mtime_raw
+        return datetime.fromtimestamp(ts) if ts is not None else None
     
     @property
     def tags(self) -> List[str]:
@@ -167,17 +259,54 @@ class LibraryItem:
 
 def get_all_library_items() -> List[LibraryItem]:
     """Get all items in the library"""
-    # Collect all unique stems from videos, audio, and transcripts
+    # One scandir per directory; the stats it yields are handed to the items
+    # so they don't stat their files again
+    scans = {
+        "video": _scan_dir(VIDEOS, ".mp4"),
+        "audio": _scan_dir(AUDIO, ".wav"),
+        "transcript": _scan_dir(TRANSCRIPTS, ".txt"),
+    }
+    
     stems = set()
+    for found in scans.values():
+        stems.update(found)
     
-    for video in VIDEOS.glob("*.mp4"):
-        stems.add(video.stem)
-    for audio in AUDIO.glob("*.wav"):
-        stems.add(audio.stem)
-    for transcript in TRANSCRIPTS.glob("*.txt"):
-        stems.add(transcript.stem)
+    # Metadata alone doesn't make an item, but its stats let items reuse cached metadata
+    scans["metadata"] = _scan_dir(METADATA, ".json")
     
-    return [LibraryItem(stem) for stem in sorted(stems)]
+    return [
+        LibraryItem(stem, {kind: found.get(stem) for kind, found in scans.items()})
+        for stem in sorted(stems)
+    ]
+
+
+@lru_cache(maxsize=64)
+def _query_pattern(query: str) -> Tuple[re.Pattern, bool]:
+    """Case-insensitive literal pattern for query; bytes when the query is ASCII"""
+    if query.isascii():
+        return re.compile(re.escape(query.encode('ascii')), re.IGNORECASE), True
+    return re.compile(re.escape(query), re.IGNORECASE), False
+
+
+def _transcript_contains(path: Path, query: str) -> bool:
+    """
+    Case-insensitive substring test against a transcript file.
+    
+    ASCII queries are matched against an mmap of the file, so the transcript
+    is never copied into Python memory, decoded or lowercased; other queries
+    decode once and still skip the lowercased copy.
+    """
+    pattern, on_bytes = _query_pattern(query)
+    try:
+        if on_bytes:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False  # empty files can't be mapped
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return pattern.search(mm) is not None
+        return pattern.search(path.read_text(encoding='utf-8')) is not None
+    except Exception:
+        return False
 
 
 def search_library(query: str, items: Optional[List[LibraryItem]] = None) -> List[LibraryItem]:
@@ -198,34 +327,100 @@ def search_library(query: str, items: Optional[List[LibraryItem]] = None) -> Lis
         return items
     
     query_lower = query.lower()
-    results = []
     
+    # The inverted index rules out transcripts that can't contain the query,
+    # so only the remaining candidates are read from disk
+    try:
+        candidates = candidate_stems(query)
+    except Exception:
+        candidates = None
+    
+    matched = set()
+    to_scan = []
     for item in items:
         # Search in stem (filename)
         if query_lower in item.stem.lower():
-            results.append(item)
+            matched.add(id(item))
             continue
         
         # Search in tags
         if any(query_lower in tag.lower() for tag in item.tags):
-            results.append(item)
+            matched.add(id(item))
             continue
         
         # Search in notes
         if query_lower in item.notes.lower():
-            results.append(item)
+            matched.add(id(item))
             continue
         
-        # Search in transcript content
+        # Search in transcript content (deferred so the reads can overlap)
+        if candidates is not None and item.stem not in candidates:
+            continue
         if item.has_transcript:
-            try:
-                content = item.transcript_path.read_text(encoding='utf-8')
-                if query_lower in content.lower():
-                    results.append(item)
-            except Exception:
-                pass
+            to_scan.append(item)
+    
+    if len(to_scan) > 1:
+        workers = min(len(to_scan), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            hits = ex.map(lambda item: _transcript_contains(item.transcript_path, query), to_scan)
+            matched.update(id(item) for item, hit in zip(to_scan, hits) if hit)
+    elif to_scan and _transcript_contains(to_scan[0].transcript_path, query):
+        matched.add(id(to_scan[0]))
+    
+    # Keep the input order
+    return [item for item in items if id(item) in matched]
+
+
+# sort_library key -> library_table column
+_SORT_COLUMNS = {
+    "name": "stem",
+    "date_created": "ctime",
+    "date_modified": "mtime",
+    "size": "size_mb",
+    "rating": "rating",
+}
+
+
+_TABLE_COLUMNS = [
+    "stem", "has_video", "has_audio", "has_transcript",
+    "size_mb", "ctime", "mtime", "rating", "tags",
+]
+
+
+def library_table(items: Optional[List[LibraryItem]] = None):
+    """
+    Columnar view of library items for vectorized filtering and sorting.
     
-    return results
+    Args:
+        items: Items to tabulate (defaults to all items)
+    
+    Returns:
+        pandas DataFrame whose row i describes items[i]; ctime/mtime are
+        epoch seconds (NaN for items with no files)
+    """
+    import pandas as pd
+    
+    if items is None:
+        items = get_all_library_items()
+    
+    # One pass over the items, touching each item's cached stats once per row
+    nan = float("nan")
+    rows = []
+    for item in items:
+        stats = item._stats()
+        rows.append((
+            item.stem,
+            item._stat_video is not None,
+            item._stat_audio is not None,
+            item._stat_transcript is not None,
+            item.total_size_mb,
+            min(st.st_ctime for st in stats) if stats else nan,
+            max(st.st_mtime for st in stats) if stats else nan,
+            item.rating,
+            item.tags,
+        ))
+    
+    return pd.DataFrame.from_records(rows, columns=_TABLE_COLUMNS)
 
 
 def filter_library(
@@ -255,27 +450,34 @@ def filter_library(
     if items is None:
         items = get_all_library_items()
     
-    results = items
+    if not items:
+        return items
+    
+    import pandas as pd
+    
+    df = library_table(items)
+    mask = pd.Series(True, index=df.index)
     
     if has_video is not None:
-        results = [item for item in results if item.has_video == has_video]
+        mask &= df["has_video"] == has_video
     
     if has_audio is not None:
-        results = [item for item in results if item.has_audio == has_audio]
+        mask &= df["has_audio"] == has_audio
     
     if has_transcript is not None:
-        results = [item for item in results if item.has_transcript == has_transcript]
+        mask &= df["has_transcript"] == has_transcript
     
     if is_complete is not None:
-        results = [item for item in results if item.is_complete == is_complete]
+        mask &= (df["has_video"] & df["has_audio"] & df["has_transcript"]) == is_complete
     
     if min_rating is not None:
-        results = [item for item in results if item.rating >= min_rating]
+        mask &= df["rating"] >= min_rating
     
     if tags:
-        results = [item for item in results if any(tag in item.tags for tag in tags)]
+        wanted = set(tags)
+        mask &= df["tags"].map(lambda item_tags: not wanted.isdisjoint(item_tags))
     
-    return results
+    return [items[i] for i in mask.to_numpy().nonzero()[0]]
 
 
 def sort_library(
@@ -294,26 +496,28 @@ def sort_library(
     Returns:
         Sorted list of items
     """
-    if sort_by == "name":
-        return sorted(items, key=lambda x: x.stem.lower(), reverse=reverse)
-    elif sort_by == "date_created":
-        return sorted(items, key=lambda x: x.created_date or datetime.min, reverse=reverse)
-    elif sort_by == "date_modified":
-        return sorted(items, key=lambda x: x.modified_date or datetime.min, reverse=reverse)
-    elif sort_by == "size":
-        return sorted(items, key=lambda x: x.total_size_mb, reverse=reverse)
-    elif sort_by == "rating":
-        return sorted(items, key=lambda x: x.rating, reverse=reverse)
-    else:
+    column = _SORT_COLUMNS.get(sort_by)
+    if column is None or not items:
         return items
+    
+    df = library_table(items)
+    key = df[column].str.lower() if column == "stem" else df[column]
+    # Stable in both directions, like sorted(..., reverse=...); items with no
+    # files sort as the oldest, as datetime.min did
+    order = key.sort_values(ascending=not reverse, kind="stable", na_position="last" if reverse else "first")
+    return [items[i] for i in order.index]
 
 
 def get_all_tags() -> List[str]:
     """Get all unique tags used in the library"""
-    items = get_all_library_items()
+    # Read tags straight from the metadata files (through the metadata cache)
+    # rather than building a LibraryItem, with its stat calls, per item
+    stems = _scan_stems(VIDEOS, ".mp4") | _scan_stems(AUDIO, ".wav") | _scan_stems(TRANSCRIPTS, ".txt")
     tags = set()
-    for item in items:
-        tags.update(item.tags)
+    for stem, st in _scan_dir(METADATA, ".json").items():
+        # Metadata left behind by a deleted item doesn't count, as before
+        if stem in stems:
+            tags.update(_read_metadata(METADATA / f"{stem}.json", st).get('tags', []))
     return sorted(tags)
 
 
@@ -356,11 +560,14 @@ def delete_library_item(item: LibraryItem, delete_video: bool = True,
         except Exception:
             results['transcript'] = False
     
-    if delete_metadata and item.metadata_path.exists():
+    if delete_metadata:
         try:
             item.metadata_path.unlink()
             results['metadata'] = True
+        except FileNotFoundError:
+            pass
         except Exception:
             results['metadata'] = False
     
+    item.invalidate()
     return results
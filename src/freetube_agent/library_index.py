@@ -0,0 +1,224 @@
+"""
+Library Search Index
+Persistent inverted index (token -> transcript stems) plus a per-transcript
+Bloom filter of character 3-grams, used to narrow full-text library
+searches to the transcripts that can possibly match.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from hashlib import blake2b
+import base64
+import os
+import re
+import threading
+
+from .paths import TRANSCRIPTS, DATA
+from .jsonio import dump_json, load_json
+
+
+INDEX_PATH = DATA / "logs" / "search.idx"
+_INDEX_VERSION = 2
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Bloom filter sizing: ~10 bits per distinct 3-gram, two hash positions each
+_BLOOM_MIN_BITS = 4096
+_BLOOM_BITS_PER_GRAM = 10
+
+# stem -> (mtime_ns, size, tokens, 3-gram bloom) for every indexed transcript
+_Doc = Tuple[int, int, List[str], bytes]
+_docs: Dict[str, _Doc] = {}
+# token -> stems containing it, derived from _docs
+_postings: Dict[str, Set[str]] = {}
+_loaded = False
+_lock = threading.Lock()
+
+
+def _tokenize(text: str) -> List[str]:
+    return sorted(set(_TOKEN_RE.findall(text.lower())))
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _bloom_positions(gram: str, mask: int) -> Tuple[int, int]:
+    h = int.from_bytes(blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'little')
+    return h & mask, (h >> 32) & mask
+
+
+def _build_bloom(grams: Set[str]) -> bytes:
+    """Bloom filter over grams; its size is a power of two bits"""
+    nbits = max(_BLOOM_MIN_BITS, 1 << (len(grams) * _BLOOM_BITS_PER_GRAM - 1).bit_length())
+    mask = nbits - 1
+    bits = bytearray(nbits // 8)
+    for gram in grams:
+        for pos in _bloom_positions(gram, mask):
+            bits[pos >> 3] |= 1 << (pos & 7)
+    return bytes(bits)
+
+
+def _bloom_may_contain(bloom: bytes, grams: Iterable[str]) -> bool:
+    """False if any gram is definitely absent from the filter"""
+    if not bloom:
+        return False
+    mask = len(bloom) * 8 - 1
+    for gram in grams:
+        for pos in _bloom_positions(gram, mask):
+            if not bloom[pos >> 3] & (1 << (pos & 7)):
+                return False
+    return True
+
+
+def _load() -> None:
+    """Populate _docs/_postings from INDEX_PATH (once per process)"""
+    global _loaded
+    _loaded = True
+    try:
+        data = load_json(INDEX_PATH)
+    except Exception:
+        return
+    if data.get("version") != _INDEX_VERSION:
+        return
+    for stem, doc in data.get("docs", {}).items():
+        bloom = base64.b64decode(doc["bloom"])
+        _add_doc(stem, (doc["mtime_ns"], doc["size"], doc["tokens"], bloom))
+
+
+def _save() -> None:
+    INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    dump_json({
+        "version": _INDEX_VERSION,
+        "docs": {
+            stem: {
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "tokens": tokens,
+                "bloom": base64.b64encode(bloom).decode('ascii'),
+            }
+            for stem, (mtime_ns, size, tokens, bloom) in _docs.items()
+        },
+    }, INDEX_PATH)
+
+
+def _add_doc(stem: str, doc: _Doc) -> None:
+    _docs[stem] = doc
+    for token in doc[2]:
+        _postings.setdefault(token, set()).add(stem)
+
+
+def _remove_doc(stem: str) -> None:
+    tokens = _docs.pop(stem)[2]
+    for token in tokens:
+        stems = _postings.get(token)
+        if stems is not None:
+            stems.discard(stem)
+            if not stems:
+                del _postings[token]
+
+
+def build_index() -> Dict[str, Set[str]]:
+    """
+    Bring the index up to date with the transcripts directory.
+
+    Only transcripts whose mtime or size changed since they were last
+    indexed are re-read; the index is written back to INDEX_PATH when
+    anything changed.
+
+    Returns:
+        Inverted index mapping token -> set of transcript stems
+    """
+    with _lock:
+        if not _loaded:
+            _load()
+
+        current = {}
+        try:
+            with os.scandir(TRANSCRIPTS) as it:
+                for entry in it:
+                    if entry.name.endswith(".txt") and not entry.name.startswith("."):
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        current[entry.name[:-4]] = (st.st_mtime_ns, st.st_size, entry.path)
+        except FileNotFoundError:
+            pass
+
+        changed = False
+        for stem in [s for s in _docs if s not in current]:
+            _remove_doc(stem)
+            changed = True
+
+        for stem, (mtime_ns, size, path) in current.items():
+            doc = _docs.get(stem)
+            if doc is not None and doc[0] == mtime_ns and doc[1] == size:
+                continue
+            try:
+                text = Path(path).read_text(encoding='utf-8').lower()
+                tokens = _tokenize(text)
+                bloom = _build_bloom(_trigrams(text))
+            except Exception:
+                # Unreadable transcripts never match a content search
+                tokens, bloom = [], b""
+            if doc is not None:
+                _remove_doc(stem)
+            _add_doc(stem, (mtime_ns, size, tokens, bloom))
+            changed = True
+
+        if changed:
+            try:
+                _save()
+            except Exception:
+                pass
+        return _postings
+
+
+def candidate_stems(query: str) -> Optional[Set[str]]:
+    """
+    Transcript stems whose content may contain query as a substring.
+
+    A query word with a non-word character on both sides must occur in a
+    matching transcript as a whole word, so those words are looked up
+    directly in the inverted index. The first and last words may be parts
+    of longer words; they, and the spaces and punctuation between words,
+    are covered by checking survivors against their 3-gram Bloom filter.
+    Candidates still need a substring check against the actual text.
+
+    Args:
+        query: Search query
+
+    Returns:
+        Set of candidate stems, or None if the query is too short to
+        filter on and every transcript must be scanned
+    """
+    query_lower = query.lower()
+    end = len(query_lower)
+    whole_words = {
+        m.group() for m in _TOKEN_RE.finditer(query_lower)
+        if m.start() > 0 and m.end() < end
+    }
+    grams = _trigrams(query_lower)
+    if not whole_words and not grams:
+        return None
+
+    postings = build_index()
+    with _lock:
+        if whole_words:
+            # Smallest posting set first so the intersection shrinks fast
+            found = sorted((postings.get(w, ()) for w in whole_words), key=len)
+            if not found[0]:
+                return set()
+            result = set(found[0])
+            for stems in found[1:]:
+                result &= stems
+                if not result:
+                    return set()
+        else:
+            result = set(_docs)
+
+        if grams:
+            result = {stem for stem in result if _bloom_may_contain(_docs[stem][3], grams)}
+        return result
@@ -1,52 +1,329 @@
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+import threading
 import time
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
 
+from .jsonio import load_json_bytes
 from .logger import logger, error_tracker, perf_logger
 
 
-def run_ollama(model: str, prompt: str, ollama_path: Optional[str] = None, timeout: int = 180) -> str:
+# Same variable the ollama CLI reads; it may omit the scheme or bind to 0.0.0.0
+OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "127.0.0.1:11434")
+
+
+def _ollama_base_url() -> str:
+    host = OLLAMA_HOST if "://" in OLLAMA_HOST else f"http://{OLLAMA_HOST}"
+    return host.replace("://0.0.0.0", "://127.0.0.1")
+
+
+@lru_cache(maxsize=1)
+def _http_client():
+    """Shared keep-alive client for the Ollama server (thread-safe)."""
+    import httpx
+
+    return httpx.Client(
+        base_url=_ollama_base_url(),
+        timeout=300,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+
+@lru_cache(maxsize=1)
+def _find_ollama() -> Optional[str]:
+    # If it isn't on PATH yet, the bare "ollama" fallback still lets Popen's
+    # own PATH lookup find a later install
+    return shutil.which("ollama")
+
+
+def _timeout_error(model: str, timeout: int, start_time: float, e: Exception) -> RuntimeError:
+    duration = time.time() - start_time
+    logger.error(f"Ollama timed out after {timeout}s")
+    error_tracker.log_error(e, context=f"Ollama timeout for model {model}", module="llm", function="run_ollama")
+    perf_logger.log_metric("run_ollama", duration, False, {"model": model, "error": "timeout"})
+    return RuntimeError(f"Ollama timed out after {timeout}s")
+
+
+def _failed_error(model: str, err: str, start_time: float) -> RuntimeError:
+    duration = time.time() - start_time
+    logger.error(f"Ollama failed: {err}")
+    error_tracker.log_error(Exception(err), context=f"Ollama model {model}", module="llm", function="run_ollama")
+    perf_logger.log_metric("run_ollama", duration, False, {"model": model})
+    return RuntimeError(f"Ollama failed: {err}")
+
+
+def _response_error(resp) -> str:
+    try:
+        err = resp.json().get("error") or resp.text
+    except ValueError:
+        err = resp.text
+    return err.strip()
+
+
+def _model_missing(resp, model: str) -> bool:
+    # The server 404s models that haven't been pulled; `ollama run` pulls them
+    if resp.status_code == 404 and "not found" in _response_error(resp).lower():
+        logger.info(f"Model {model} not pulled on the server, using CLI to pull it")
+        return True
+    return False
+
+
+def run_ollama_stream(
+    model: str,
+    prompt: str,
+    ollama_path: Optional[str] = None,
+    timeout: int = 180,
+    output_format: Optional[str] = None,
+    system: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Run an Ollama model and yield its output as it is generated.
+
+    Streams token fragments from the Ollama HTTP API on the shared client;
+    if the server can't be reached or lacks the model, or ollama_path is
+    given, uses the ollama CLI instead, which yields whole lines. Either
+    way the pieces concatenate to the full response. output_format and
+    system behave as in run_ollama.
+
+    Raises RuntimeError if Ollama is missing, times out, or fails; closing
+    the generator early drops the request (or kills the CLI process).
+    """
+    stream = None if ollama_path else _stream_http(model, prompt, timeout, output_format, system)
+    if stream is not None:
+        yield from stream
+        return
+    cli_prompt = f"{system}\n\n{prompt}" if system else prompt
+    yield from _stream_cli(model, cli_prompt, ollama_path, timeout, output_format)
+
+
+def _stream_http(
+    model: str,
+    prompt: str,
+    timeout: int,
+    output_format: Optional[str],
+    system: Optional[str],
+) -> Optional[Iterator[str]]:
+    """
+    Start a streaming /api/generate request.
+
+    Returns None when the server can't be reached, doesn't have the model
+    (or httpx is missing), otherwise an iterator over the response
+    fragments. timeout bounds the whole generation, not just each read.
+    """
+    try:
+        import httpx
+
+        client = _http_client()
+    except ImportError:
+        return None
+
+    payload = {"model": model, "prompt": prompt, "stream": True}
+    if output_format:
+        payload["format"] = output_format
+    if system:
+        payload["system"] = system
+
+    start_time = time.time()
+    logger.info(f"Streaming Ollama model: {model} (timeout={timeout}s)")
+    request = client.build_request("POST", "/api/generate", json=payload, timeout=timeout)
+    try:
+        resp = client.send(request, stream=True)
+    except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+        logger.debug(f"Ollama server not reachable at {_ollama_base_url()}, using CLI: {e}")
+        return None
+    except httpx.TimeoutException as e:
+        raise _timeout_error(model, timeout, start_time, e) from e
+
+    if resp.status_code != 200:
+        try:
+            resp.read()
+        finally:
+            resp.close()
+        if _model_missing(resp, model):
+            return None
+        raise _failed_error(model, _response_error(resp), start_time)
+
+    def fragments() -> Iterator[str]:
+        deadline = start_time + timeout
+        try:
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                part = load_json_bytes(line.encode('utf-8'))
+                if part.get("error"):
+                    raise _failed_error(model, str(part["error"]).strip(), start_time)
+                if part.get("response"):
+                    yield part["response"]
+                if part.get("done"):
+                    break
+                if time.time() > deadline:
+                    raise _timeout_error(model, timeout, start_time, TimeoutError(f"generation exceeded {timeout}s"))
+        except httpx.TimeoutException as e:
+            raise _timeout_error(model, timeout, start_time, e) from e
+        finally:
+            resp.close()
+
+    return fragments()
+
+
+def _stream_cli(
+    model: str,
+    prompt: str,
+    ollama_path: Optional[str],
+    timeout: int,
+    output_format: Optional[str],
+) -> Iterator[str]:
+    """Run `ollama run` and yield its stdout line by line; output_format maps to --format."""
     start_time = time.time()
     logger.info(f"Running Ollama model: {model} (timeout={timeout}s)")
     logger.debug(f"Prompt length: {len(prompt)} characters")
-    
-    exe = ollama_path or shutil.which("ollama") or "ollama"
+
+    exe = ollama_path or _find_ollama() or "ollama"
     logger.debug(f"Using Ollama executable: {exe}")
-    
+
+    cmd = [exe, "run", model]
+    if output_format:
+        cmd += ["--format", output_format]
+
     # Prefer passing prompt via stdin to avoid shell quoting issues
     try:
-        cp = subprocess.run(
-            [exe, "run", model],
-            input=prompt,
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            capture_output=True,
-            timeout=timeout,
+            bufsize=1,
         )
     except FileNotFoundError as e:
         logger.error("Ollama executable not found. Add to PATH or provide full path.")
         error_tracker.log_error(e, context=f"Running Ollama model {model}", module="llm", function="run_ollama")
         raise RuntimeError("Ollama executable not found. Add to PATH or provide full path.") from e
-    except subprocess.TimeoutExpired as e:
-        duration = time.time() - start_time
-        logger.error(f"Ollama timed out after {timeout}s")
-        error_tracker.log_error(e, context=f"Ollama timeout for model {model}", module="llm", function="run_ollama")
-        perf_logger.log_metric("run_ollama", duration, False, {"model": model, "error": "timeout"})
-        raise RuntimeError(f"Ollama timed out after {timeout}s") from e
-    
-    if cp.returncode != 0:
-        err = (cp.stderr or "").strip()
-        duration = time.time() - start_time
-        logger.error(f"Ollama failed: {err}")
-        error_tracker.log_error(Exception(err), context=f"Ollama model {model}", module="llm", function="run_ollama")
-        perf_logger.log_metric("run_ollama", duration, False, {"model": model})
-        raise RuntimeError(f"Ollama failed: {err}")
-    
-    result = (cp.stdout or "").strip()
+
+    timed_out = threading.Event()
+
+    def on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    def feed():
+        try:
+            proc.stdin.write(prompt)
+            proc.stdin.close()
+        except OSError:
+            pass  # process exited early; its stderr/returncode tell why
+
+    stderr_parts = []
+
+    # stdin and stderr are serviced on their own threads so a large prompt or
+    # chatty stderr can't deadlock against the stdout reader
+    timer = threading.Timer(timeout, on_timeout)
+    timer.daemon = True
+    helpers = [
+        threading.Thread(target=feed, daemon=True),
+        threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True),
+    ]
+    timer.start()
+    for t in helpers:
+        t.start()
+
+    try:
+        for line in proc.stdout:
+            yield line
+        proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        for t in helpers:
+            t.join()
+        proc.stdout.close()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        e = subprocess.TimeoutExpired(cmd, timeout)
+        raise _timeout_error(model, timeout, start_time, e) from e
+
+    if proc.returncode != 0:
+        raise _failed_error(model, "".join(stderr_parts).strip(), start_time)
+
+
+def _generate_http(
+    model: str,
+    prompt: str,
+    timeout: int,
+    output_format: Optional[str],
+    system: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Run one generation through the Ollama HTTP API on the shared client.
+
+    Returns None when the server can't be reached or doesn't have the model
+    (or httpx is missing) so the caller can fall back to the CLI; raises
+    RuntimeError like the CLI path for timeouts and server-side errors.
+    """
+    try:
+        import httpx
+
+        client = _http_client()
+    except ImportError:
+        return None
+
+    payload = {"model": model, "prompt": prompt, "stream": False}
+    if output_format:
+        payload["format"] = output_format
+    if system:
+        payload["system"] = system
+
+    start_time = time.time()
+    try:
+        resp = client.post("/api/generate", json=payload, timeout=timeout)
+    except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+        logger.debug(f"Ollama server not reachable at {_ollama_base_url()}, using CLI: {e}")
+        return None
+    except httpx.TimeoutException as e:
+        raise _timeout_error(model, timeout, start_time, e) from e
+
+    if resp.status_code != 200:
+        if _model_missing(resp, model):
+            return None
+        raise _failed_error(model, _response_error(resp), start_time)
+
+    return resp.json().get("response", "")
+
+
+def run_ollama(
+    model: str,
+    prompt: str,
+    ollama_path: Optional[str] = None,
+    timeout: int = 180,
+    output_format: Optional[str] = None,
+    system: Optional[str] = None,
+) -> str:
+    """
+    Run an Ollama model to completion and return its stripped output.
+
+    Talks to the running Ollama server over a shared keep-alive HTTP
+    connection. Spawns the ollama CLI instead when ollama_path is given,
+    when the server can't be reached, or when it hasn't pulled the model
+    (`ollama run` pulls it first, as before).
+
+    system replaces the model's system prompt; keeping it identical across
+    calls lets the server reuse its cached prefix. The CLI has no system
+    flag, so there it is prepended to the prompt instead.
+    """
+    start_time = time.time()
+    result = None if ollama_path else _generate_http(model, prompt, timeout, output_format, system)
+    if result is None:
+        cli_prompt = f"{system}\n\n{prompt}" if system else prompt
+        result = "".join(_stream_cli(model, cli_prompt, ollama_path, timeout, output_format))
+    result = result.strip()
     duration = time.time() - start_time
     logger.info(f"Ollama completed: {len(result)} characters in {duration:.1f}s")
     perf_logger.log_metric("run_ollama", duration, True, {"model": model, "output_chars": len(result)})
     return result
-
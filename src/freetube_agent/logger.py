@@ -10,10 +10,17 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 from functools import wraps
 from datetime import datetime
+from collections import deque
+import atexit
+import os
+import queue
+import random
+import threading
+import time
 import traceback
-import json
 
 from .paths import DATA
+from .jsonio import load_json, load_json_bytes, json_line
 
 
 # Log directory
@@ -38,11 +45,21 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # stdout doesn't change between records: check for a terminal once
+        # and build each colored level name up front
+        isatty = getattr(sys.stdout, 'isatty', None)
+        self._is_tty = bool(isatty and isatty())
+        self._colored = {
+            level: f"{color}{level}{self.COLORS['RESET']}"
+            for level, color in self.COLORS.items()
+            if level != 'RESET'
+        }
+    
     def format(self, record):
-        if hasattr(sys.stdout, 'isatty') and sys.stdout.isatty():
-            levelname = record.levelname
-            if levelname in self.COLORS:
-                record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        if self._is_tty:
+            record.levelname = self._colored.get(record.levelname, record.levelname)
         return super().format(record)
 
 
@@ -108,27 +125,65 @@ logger = setup_logger()
 class ErrorTracker:
     """Track and log errors with context"""
     
+    MAX_ERRORS = 1000       # Entries kept on disk
+    COMPACT_EVERY = 100     # Appends between rewrites of the history file
+    
     def __init__(self):
-        self.error_log_path = LOG_DIR / "error_tracker.json"
+        self.error_log_path = LOG_DIR / "errors.jsonl"
+        self.legacy_log_path = LOG_DIR / "error_tracker.json"
+        self._appends = 0
         self.errors = self._load_errors()
     
     def _load_errors(self) -> list:
-        """Load error history from file"""
-        if self.error_log_path.exists():
+        """Load error history from file (the last MAX_ERRORS lines)"""
+        try:
+            with open(self.error_log_path, 'rb') as f:
+                lines = deque(f, maxlen=self.MAX_ERRORS)
+        except FileNotFoundError:
+            return self._migrate_legacy()
+        except Exception:
+            return []
+        
+        errors = []
+        for line in lines:
             try:
-                with open(self.error_log_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                errors.append(load_json_bytes(line))
             except Exception:
-                return []
-        return []
+                continue  # e.g. a line cut short by a crash mid-write
+        return errors
+    
+    def _migrate_legacy(self) -> list:
+        """Carry over history from the old single-array error_tracker.json"""
+        try:
+            errors = load_json(self.legacy_log_path)[-self.MAX_ERRORS:]
+        except Exception:
+            return []
+        self.errors = errors
+        self._save_errors()
+        return errors
     
     def _save_errors(self):
-        """Save error history to file"""
+        """Rewrite the history file with the last MAX_ERRORS errors"""
+        try:
+            tmp = self.error_log_path.with_suffix('.jsonl.tmp')
+            with open(tmp, 'wb') as f:
+                f.writelines(json_line(e) for e in self.errors[-self.MAX_ERRORS:])
+            os.replace(tmp, self.error_log_path)
+            self._appends = 0
+        except Exception as e:
+            logger.error(f"Failed to save error history: {e}")
+    
+    def _append_error(self, error_entry: dict):
+        """Append one error to the history file, compacting it now and then"""
         try:
-            with open(self.error_log_path, 'w', encoding='utf-8') as f:
-                json.dump(self.errors[-1000:], f, indent=2)  # Keep last 1000 errors
+            with open(self.error_log_path, 'ab') as f:
+                f.write(json_line(error_entry))
         except Exception as e:
             logger.error(f"Failed to save error history: {e}")
+            return
+        self._appends += 1
+        if self._appends >= self.COMPACT_EVERY:
+            self._save_errors()
     
     def log_error(
         self,
@@ -148,6 +203,10 @@ class ErrorTracker:
             function: Function where error occurred
             user_message: User-friendly error message
         """
+        # Format the traceback once, and only when an exception is being handled
+        # (format_exc() outside an except block just yields "NoneType: None")
+        tb = traceback.format_exc() if sys.exc_info()[0] is not None else ""
+        
         error_entry = {
             'timestamp': datetime.now().isoformat(),
             'type': type(error).__name__,
@@ -156,17 +215,17 @@ class ErrorTracker:
             'module': module,
             'function': function,
             'user_message': user_message,
-            'traceback': traceback.format_exc()
+            'traceback': tb
         }
         
         self.errors.append(error_entry)
-        self._save_errors()
+        self._append_error(error_entry)
         
         # Log to file
         logger.error(
             f"Error in {module}.{function}: {error}\n"
             f"Context: {context}\n"
-            f"Traceback: {traceback.format_exc()}"
+            f"Traceback: {tb}"
         )
     
     def get_recent_errors(self, count: int = 10) -> list:
@@ -205,16 +264,24 @@ def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    max_delay: float = 60.0,
+    max_total: Optional[float] = None
 ):
     """
     Decorator to retry a function on failure.
     
+    Delays grow exponentially up to max_delay, with up to 10% random jitter
+    so parallel callers that failed together don't retry in lockstep.
+    
     Args:
         max_attempts: Maximum number of attempts
         delay: Initial delay between attempts (seconds)
         backoff: Multiplier for delay after each attempt
         exceptions: Tuple of exceptions to catch
+        max_delay: Upper bound on a single delay (seconds)
+        max_total: Optional overall time budget (seconds); no retry is started
+            whose delay would run past it
     
     Example:
         @retry(max_attempts=3, delay=1.0)
@@ -226,24 +293,28 @@ def retry(
         def wrapper(*args, **kwargs) -> Any:
             attempt = 1
             current_delay = delay
+            deadline = time.monotonic() + max_total if max_total is not None else None
             
             while attempt <= max_attempts:
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    if attempt == max_attempts:
+                    sleep_for = min(current_delay, max_delay)
+                    sleep_for += random.uniform(0, sleep_for * 0.1)
+                    out_of_time = deadline is not None and time.monotonic() + sleep_for > deadline
+                    
+                    if attempt == max_attempts or out_of_time:
                         logger.error(
-                            f"Function {func.__name__} failed after {max_attempts} attempts: {e}"
+                            f"Function {func.__name__} failed after {attempt} attempts: {e}"
                         )
                         raise
                     
                     logger.warning(
                         f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}. "
-                        f"Retrying in {current_delay}s..."
+                        f"Retrying in {sleep_for:.1f}s..."
                     )
                     
-                    import time
-                    time.sleep(current_delay)
+                    time.sleep(sleep_for)
                     current_delay *= backoff
                     attempt += 1
         
@@ -315,6 +386,13 @@ class PerformanceLogger:
     
     def __init__(self):
         self.metrics_file = PERFORMANCE_LOG
+        # Metrics are queued and written in batches by a daemon thread through
+        # one persistent handle, so log_metric never touches the filesystem
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._fh = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
     
     def log_metric(
         self,
@@ -333,10 +411,57 @@ class PerformanceLogger:
         }
         
         try:
-            with open(self.metrics_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(entry) + '\n')
+            self._queue.put(json_line(entry))
         except Exception as e:
             logger.error(f"Failed to log performance metric: {e}")
+            return
+        if self._writer is None:
+            self._start_writer()
+    
+    def _start_writer(self):
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._run, name="perf-logger", daemon=True)
+            self._writer.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+    
+    def _run(self):
+        """Writer thread: drain the queue, write each batch with one call"""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            data = b"".join(line for line in batch if line is not None)
+            if data:
+                try:
+                    if self._fh is None:
+                        self._fh = open(self.metrics_file, 'ab', buffering=64 * 1024)
+                    self._fh.write(data)
+                    self._fh.flush()
+                except Exception as e:
+                    logger.error(f"Failed to log performance metric: {e}")
+            if None in batch:
+                return
+    
+    def close(self):
+        """Write out queued metrics and close the log file"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                self._queue.put(None)
+                writer.join(timeout=5)
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                except Exception:
+                    pass
+                self._fh = None
     
     def measure(self, operation: str):
         """
@@ -346,8 +471,6 @@ class PerformanceLogger:
             with perf_logger.measure("download_video"):
                 download_video(url)
         """
-        import time
-        
         class Timer:
             def __enter__(self):
                 self.start = time.time()
@@ -371,8 +494,6 @@ def log_function_call(func: Callable) -> Callable:
     """Decorator to log function calls and execution time"""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        import time
-        
         func_name = f"{func.__module__}.{func.__name__}"
         logger.debug(f"Calling {func_name}")
         
@@ -394,8 +515,6 @@ def log_function_call(func: Callable) -> Callable:
 
 def clear_old_logs(days: int = 30):
     """Delete log files older than specified days"""
-    import time
-    
     current_time = time.time()
     cutoff_time = current_time - (days * 86400)  # days to seconds
     
@@ -403,6 +522,8 @@ def clear_old_logs(days: int = 30):
     for log_file in LOG_DIR.glob("*.log"):
         try:
             if log_file.stat().st_mtime < cutoff_time:
+                if log_file == PERFORMANCE_LOG:
+                    perf_logger.close()  # next metric reopens a fresh file
                 log_file.unlink()
                 deleted_count += 1
         except Exception as e:
@@ -5,7 +5,8 @@ DATA = ROOT / "data"
 VIDEOS = DATA / "videos"
 AUDIO = DATA / "audio"
 TRANSCRIPTS = DATA / "transcripts"
+METADATA = DATA / "metadata"
 
-for p in (DATA, VIDEOS, AUDIO, TRANSCRIPTS):
+for p in (DATA, VIDEOS, AUDIO, TRANSCRIPTS, METADATA):
     p.mkdir(parents=True, exist_ok=True)
 
@@ -4,7 +4,13 @@ Handles video playback, timestamp parsing, and transcript synchronization.
 """
 
 from __future__ import annotations
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from html import escape
+from itertools import accumulate, islice
+import io
 import re
 
 
@@ -18,14 +24,19 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(total: int) -> str:
+    # Transcript renders format the same few thousand second values over and over
+    minutes, secs = divmod(total, 60)
+    hours, minutes = divmod(minutes, 60)
     
     if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return "%02d:%02d:%02d" % (hours, minutes, secs)
     else:
-        return f"{minutes:02d}:{secs:02d}"
+        return "%02d:%02d" % (minutes, secs)
 
 
 def parse_timestamp(timestamp_str: str) -> float:
@@ -56,10 +67,86 @@ def parse_timestamp(timestamp_str: str) -> float:
         return 0.0
 
 
+class SegmentIndex:
+    """
+    Lookup structure for finding the segment that contains a playback time.
+    
+    Holds the segment starts and a running maximum of their ends, so the
+    first segment containing a time is found with two bisections; the last
+    hit is tried first since playback usually stays in or just after it.
+    Back-to-back segments (each ending exactly where the next starts, as
+    Whisper usually emits them) need only a single bisection on the starts.
+    """
+    
+    def __init__(self, segments: List[Dict[str, Any]], starts: Optional[array] = None, ends: Optional[array] = None):
+        self.segments = segments
+        self.size = len(segments)
+        self.starts = starts if starts is not None else _segment_times(segments, 'start')
+        self.ends = ends if ends is not None else _segment_times(segments, 'end')
+        self.max_ends = array('d', accumulate(self.ends, max))
+        self.is_sorted = all(a <= b for a, b in zip(self.starts, islice(self.starts, 1, None)))
+        self.contiguous = (
+            all(start <= end for start, end in zip(self.starts, self.ends))
+            and all(end == start for end, start in zip(self.ends, islice(self.starts, 1, None)))
+        )
+        self.hint = 0
+    
+    def _is_first_match(self, idx: int, current_time: float) -> bool:
+        return (
+            self.starts[idx] <= current_time <= self.ends[idx]
+            and (idx == 0 or self.max_ends[idx - 1] < current_time)
+        )
+    
+    def find(self, current_time: float) -> Optional[int]:
+        """Index of the first segment with start <= current_time <= end, or None"""
+        if self.contiguous:
+            # Segment j-1 ends where segment j starts, at or after the time
+            j = bisect_left(self.starts, current_time)
+            if j == 0:
+                return 0 if self.size and self.starts[0] == current_time else None
+            if j == self.size and current_time > self.ends[-1]:
+                return None
+            return j - 1
+        
+        if not self.is_sorted:
+            for idx in range(self.size):
+                if self.starts[idx] <= current_time <= self.ends[idx]:
+                    return idx
+            return None
+        
+        for idx in (self.hint, self.hint + 1):
+            if idx < self.size and self._is_first_match(idx, current_time):
+                self.hint = idx
+                return idx
+        
+        # Last segment starting at or before the time, then the first one up
+        # to it whose end reaches the time (max_ends is non-decreasing)
+        last = bisect_right(self.starts, current_time) - 1
+        if last < 0:
+            return None
+        first = bisect_left(self.max_ends, current_time, 0, last + 1)
+        if first > last:
+            return None
+        self.hint = first
+        return first
+
+
+def _segment_times(segments: List[Dict[str, Any]], key: str) -> array:
+    return array('d', [seg.get(key, 0.0) for seg in segments])
+
+
+# Index for the most recently searched segment list
+_segment_index: Optional[SegmentIndex] = None
+
+
 def find_current_segment(current_time: float, segments: List[Dict[str, Any]]) -> Optional[int]:
     """
     Find the segment index that contains the current time.
     
+    The lookup index is reused while the same segment list is passed in.
+    A new list with the same start/end times (Streamlit rebuilds the segment
+    dicts on every rerun) reuses it too, after one pass to compare times.
+    
     Args:
         current_time: Current playback time in seconds
         segments: List of segment dicts with 'start' and 'end' keys
@@ -67,12 +154,16 @@ def find_current_segment(current_time: float, segments: List[Dict[str, Any]]) ->
     Returns:
         Index of current segment, or None if not found
     """
-    for idx, seg in enumerate(segments):
-        start = seg.get('start', 0.0)
-        end = seg.get('end', 0.0)
-        if start <= current_time <= end:
-            return idx
-    return None
+    global _segment_index
+    index = _segment_index
+    if index is None or index.segments is not segments or index.size != len(segments):
+        starts = _segment_times(segments, 'start')
+        ends = _segment_times(segments, 'end')
+        if index is not None and index.starts == starts and index.ends == ends:
+            index.segments = segments
+        else:
+            index = _segment_index = SegmentIndex(segments, starts, ends)
+    return index.find(current_time)
 
 
 def generate_video_html(video_path: str, width: str = "100%", autoplay: bool = False) -> str:
@@ -120,6 +211,24 @@ def generate_video_html(video_path: str, width: str = "100%", autoplay: bool = F
     return html
 
 
+# One clickable transcript row for create_clickable_transcript
+_TRANSCRIPT_SEGMENT_HTML = """
+        <div class="transcript-segment" id="segment-{idx}" 
+             style="padding: 10px; margin: 5px 0; background-color: {bg_color}; 
+                    border-radius: 5px; cursor: pointer; transition: background-color 0.3s;"
+             onmouseover="this.style.backgroundColor='#e8e8e8'"
+             onmouseout="this.style.backgroundColor='{bg_color}'"
+             onclick="window.parent.postMessage({{type: 'seekTo', time: {start}}}, '*')">
+            <span style="color: #3ea6ff; font-weight: bold; font-family: monospace;">
+                [{timestamp}]
+            </span>
+            <span style="margin-left: 10px;">
+                {text}
+            </span>
+        </div>
+        """
+
+
 def create_clickable_transcript(
     segments: List[Dict[str, Any]], 
     current_segment_idx: Optional[int] = None,
@@ -136,48 +245,72 @@ def create_clickable_transcript(
     Returns:
         HTML string for clickable transcript
     """
-    html_parts = ['<div class="transcript-container" style="max-height: 600px; overflow-y: auto;">']
+    out = io.StringIO()
+    for piece in iter_clickable_transcript(segments, current_segment_idx, highlight_color):
+        out.write(piece)
+    return out.getvalue()
+
+
+def iter_clickable_transcript(
+    segments: List[Dict[str, Any]], 
+    current_segment_idx: Optional[int] = None,
+    highlight_color: str = "#ffd700"
+) -> Iterator[str]:
+    """
+    Stream the create_clickable_transcript HTML piece by piece.
     
-    for idx, seg in enumerate(segments):
-        start = seg.get('start', 0.0)
-        end = seg.get('end', 0.0)
-        text = seg.get('text', '').strip()
-        
-        timestamp_str = format_timestamp(start)
-        
-        # Highlight current segment
-        bg_color = highlight_color if idx == current_segment_idx else "transparent"
-        
-        html_parts.append(f"""
-        <div class="transcript-segment" id="segment-{idx}" 
-             style="padding: 10px; margin: 5px 0; background-color: {bg_color}; 
-                    border-radius: 5px; cursor: pointer; transition: background-color 0.3s;"
-             onmouseover="this.style.backgroundColor='#e8e8e8'"
-             onmouseout="this.style.backgroundColor='{bg_color}'"
-             onclick="window.parent.postMessage({{type: 'seekTo', time: {start}}}, '*')">
-            <span style="color: #3ea6ff; font-weight: bold; font-family: monospace;">
-                [{timestamp_str}]
-            </span>
-            <span style="margin-left: 10px;">
-                {text}
-            </span>
-        </div>
-        """)
+    Joining the pieces gives exactly the create_clickable_transcript
+    string; consumers that write as they go never hold every row at once.
+    
+    Args:
+        segments: List of segment dicts with 'start', 'end', 'text'
+        current_segment_idx: Index of currently playing segment
+        highlight_color: Color to highlight current segment
+    
+    Yields:
+        Consecutive chunks of the HTML string
+    """
+    yield '<div class="transcript-container" style="max-height: 600px; overflow-y: auto;">'
     
-    html_parts.append('</div>')
+    for row in _iter_segment_html(segments, current_segment_idx, highlight_color):
+        yield '\n'
+        yield row
+    
+    yield '\n</div>'
     
     # Add auto-scroll script
     if current_segment_idx is not None:
-        html_parts.append(f"""
+        yield '\n'
+        yield f"""
         <script>
             const currentSegment = document.getElementById('segment-{current_segment_idx}');
             if (currentSegment) {{
                 currentSegment.scrollIntoView({{behavior: 'smooth', block: 'center'}});
             }}
         </script>
-        """)
-    
-    return '\n'.join(html_parts)
+        """
+
+
+def _iter_segment_html(
+    segments: List[Dict[str, Any]],
+    current_segment_idx: Optional[int],
+    highlight_color: str,
+) -> Iterator[str]:
+    render = _TRANSCRIPT_SEGMENT_HTML.format
+    for idx, seg in enumerate(segments):
+        start = seg.get('start', 0.0)
+        yield render(
+            idx=idx,
+            start=start,
+            # Highlight current segment
+            bg_color=highlight_color if idx == current_segment_idx else "transparent",
+            timestamp=_format_whole_seconds(int(start)),
+            text=escape(seg.get('text', '').strip()),
+        )
+
+
+# Bracketed timestamps in transcript text: [HH:MM:SS] or [MM:SS]
+_TIMESTAMP_RE = re.compile(r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]')
 
 
 def extract_timestamps_from_text(text: str) -> List[Tuple[float, str]]:
@@ -190,21 +323,23 @@ def extract_timestamps_from_text(text: str) -> List[Tuple[float, str]]:
     Returns:
         List of (timestamp_seconds, text) tuples
     """
-    # Pattern to match timestamps: [HH:MM:SS], [MM:SS], or [SS]
-    pattern = r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]'
-    
     results = []
-    parts = re.split(pattern, text)
-    
-    # parts will be: [text_before_first_timestamp, timestamp1, text1, timestamp2, text2, ...]
-    for i in range(1, len(parts), 2):
-        if i < len(parts):
-            timestamp_str = parts[i]
-            text_content = parts[i + 1].strip() if i + 1 < len(parts) else ""
-            
+    
+    # Each timestamp owns the text up to the next one (or the end)
+    prev_ts = None
+    prev_end = 0
+    for m in _TIMESTAMP_RE.finditer(text):
+        if prev_ts is not None:
+            text_content = text[prev_end:m.start()].strip()
             if text_content:
-                seconds = parse_timestamp(timestamp_str)
-                results.append((seconds, text_content))
+                results.append((parse_timestamp(prev_ts), text_content))
+        prev_ts = m.group(1)
+        prev_end = m.end()
+    
+    if prev_ts is not None:
+        text_content = text[prev_end:].strip()
+        if text_content:
+            results.append((parse_timestamp(prev_ts), text_content))
     
     return results
 
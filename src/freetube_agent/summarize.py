@@ -4,43 +4,81 @@ Generates summaries, key points, and insights from transcripts using local LLM.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from collections import OrderedDict
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+import os
+import re
+import threading
 
-from .llm import run_ollama
+from .llm import run_ollama, run_ollama_stream
 from .transcribe import Transcript
+from .jsonio import load_json_bytes
 from .logger import logger, error_tracker
 
 
-def generate_summary(
-    transcript: Transcript,
-    model: str = "llama3.2",
-    ollama_path: Optional[str] = None,
-    style: str = "comprehensive"
-) -> Dict[str, Any]:
-    """
-    Generate a comprehensive summary of the video transcript.
-    
-    Args:
-        transcript: Transcript object with text and segments
-        model: Ollama model to use
-        ollama_path: Optional path to Ollama executable
-        style: Summary style - "comprehensive", "brief", "academic", "casual"
-    
-    Returns:
-        Dictionary with summary components
-    """
-    logger.info(f"Generating {style} summary (model={model})")
-    text = transcript.text
-    word_count = len(text.split())
-    logger.debug(f"Transcript length: {word_count} words")
-    
-    # Build prompt based on style
-    if style == "comprehensive":
-        prompt = f"""Analyze this video transcript and provide a comprehensive summary.
-
-Transcript:
-{text}
+# Transcripts estimated above this many tokens are summarized map-reduce style:
+# each ~MAP_CHUNK_TOKENS section is summarized on its own (in parallel), then the
+# section summaries are summarized in the requested style
+MAP_REDUCE_THRESHOLD_TOKENS = 4000
+MAP_CHUNK_TOKENS = 2000
+
+# blake2b(model, section text) -> section summary, least recently used first;
+# the map prompt doesn't depend on the style, so re-running with another style
+# (or another analysis prompt) only repeats the reduce step
+_section_summaries: OrderedDict[str, str] = OrderedDict()
+_section_lock = threading.Lock()
+SECTION_CACHE_SIZE = 256
+
+
+def _ollama_parallelism() -> int:
+    # FTA_OLLAMA_PARALLEL picks the fan-out; more in-flight requests than the
+    # server's OLLAMA_NUM_PARALLEL slots would only queue server-side
+    requested = os.environ.get("FTA_OLLAMA_PARALLEL", "4")
+    workers = int(requested) if requested.isdigit() else 4
+    server_slots = os.environ.get("OLLAMA_NUM_PARALLEL")
+    if server_slots and server_slots.isdigit() and int(server_slots) > 0:
+        workers = min(workers, int(server_slots))
+    return max(1, workers)
+
+
+# Shared by generate_full_analysis for its four prompts. Only top-level calls
+# are submitted here: a task that waited on further _POOL work could deadlock.
+_POOL = ThreadPoolExecutor(max_workers=_ollama_parallelism(), thread_name_prefix="ollama")
+# Caps in-flight requests across _POOL tasks and the map-phase workers they start
+_OLLAMA_SLOTS = threading.BoundedSemaphore(_ollama_parallelism())
+
+
+def _run_ollama_limited(**kwargs: Any) -> str:
+    """run_ollama, waiting for one of the _OLLAMA_SLOTS first."""
+    with _OLLAMA_SLOTS:
+        return run_ollama(**kwargs)
+
+
+# Response line parsers; [^\S\n] is whitespace within a line.
+# Key points: a "- ", "• " or "* " bullet's text, or any other non-empty line
+# not starting with "#".
+_KEY_POINT_RE = re.compile(
+    r"^[^\S\n]*(?:[-•*] [^\S\n]*(\S.*?)|([^#\s].*?))[^\S\n]*$",
+    re.MULTILINE,
+)
+# Topics: "Name: Description" lines; a leading number is dropped up to the
+# first "." (lines starting with a digit and containing "." must have a ":"
+# after it).
+_TOPIC_RE = re.compile(
+    r"^[^\S\n]*(?:\d[^.\n]*\.|(?![^\S\n]|\d[^.\n]*\.))[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+# Per summary style: (system prompt, instructions that follow the transcript).
+# Unknown styles use "casual".
+STYLE_PROMPTS: Dict[str, Tuple[str, str]] = {
+    "comprehensive": (
+        "Analyze this video transcript and provide a comprehensive summary.",
+        """
 
 Please provide:
 1. A 3-5 sentence overview
@@ -49,25 +87,21 @@ Please provide:
 4. Target audience
 5. Key takeaways
 
-Format your response clearly with headers."""
-
-    elif style == "brief":
-        prompt = f"""Summarize this video transcript briefly.
-
-Transcript:
-{text}
+Format your response clearly with headers.""",
+    ),
+    "brief": (
+        "Summarize this video transcript briefly.",
+        """
 
 Provide:
 1. One paragraph summary (3-4 sentences)
 2. 3 key points (bullets)
 
-Be concise."""
-
-    elif style == "academic":
-        prompt = f"""Provide an academic summary of this video transcript.
-
-Transcript:
-{text}
+Be concise.""",
+    ),
+    "academic": (
+        "Provide an academic summary of this video transcript.",
+        """
 
 Include:
 1. Abstract (150 words)
@@ -76,24 +110,171 @@ Include:
 4. Methodology (if applicable)
 5. Conclusions
 
-Use formal academic language."""
-
-    else:  # casual
-        prompt = f"""Give a casual, friendly summary of this video.
-
-Transcript:
-{text}
+Use formal academic language.""",
+    ),
+    "casual": (
+        "Give a casual, friendly summary of this video.",
+        """
 
 Include:
 1. Quick overview in simple language
 2. Cool highlights (3-5 bullets)
 3. Why someone should watch this
 
-Keep it conversational and engaging."""
+Keep it conversational and engaging.""",
+    ),
+}
+
+
+def _estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English text
+    return len(text) // 4
+
+
+def _chunk_by_segments(transcript: Transcript, max_tokens: int = MAP_CHUNK_TOKENS) -> List[str]:
+    """
+    Group transcript segments into sections of roughly max_tokens tokens.
+    
+    Segments longer than the budget on their own (e.g. a transcript loaded
+    as one block of text) are split on word boundaries.
+    
+    Args:
+        transcript: Transcript object
+        max_tokens: Approximate token budget per section
+    
+    Returns:
+        List of section texts, in transcript order
+    """
+    budget = max_tokens * 4
+    pieces: List[str] = []
+    for raw in [seg.text for seg in transcript.segments] or [transcript.text]:
+        text = raw.strip()
+        if len(text) <= budget:
+            if text:
+                pieces.append(text)
+            continue
+        words: List[str] = []
+        size = 0
+        for word in text.split():
+            if words and size + len(word) + 1 > budget:
+                pieces.append(" ".join(words))
+                words, size = [], 0
+            words.append(word)
+            size += len(word) + 1
+        if words:
+            pieces.append(" ".join(words))
+    
+    sections: List[str] = []
+    current: List[str] = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(piece) + 1 > budget:
+            sections.append(" ".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 1
+    if current:
+        sections.append(" ".join(current))
+    return sections
+
+
+def _summarize_section(section: str, model: str, ollama_path: Optional[str]) -> str:
+    key = blake2b(f"{model}\0{section}".encode('utf-8'), digest_size=16).hexdigest()
+    with _section_lock:
+        cached = _section_summaries.get(key)
+        if cached is not None:
+            _section_summaries.move_to_end(key)
+            return cached
+    
+    prompt = f"""Summarize this section of a longer video transcript.
+
+Section:
+{section}
+
+Capture every distinct point, topic, name and conclusion in a dense paragraph of at most 200 words."""
+
+    summary = _run_ollama_limited(model=model, prompt=prompt, ollama_path=ollama_path, timeout=180)
+    with _section_lock:
+        _section_summaries[key] = summary
+        if len(_section_summaries) > SECTION_CACHE_SIZE:
+            _section_summaries.popitem(last=False)
+    return summary
+
+
+def _condensed_source(transcript: Transcript, model: str, ollama_path: Optional[str]) -> Tuple[str, str, int]:
+    """
+    Return the text to put in a prompt in place of the full transcript.
+    
+    Transcripts over MAP_REDUCE_THRESHOLD_TOKENS are replaced by their
+    section summaries (summarized in parallel, cached), so every prompt
+    built from them fits the model's context window.
+    
+    Args:
+        transcript: Transcript object
+        model: Ollama model
+        ollama_path: Optional Ollama path
+    
+    Returns:
+        (label, text, number of sections) - label names what text is
+    """
+    text = transcript.text
+    if _estimate_tokens(text) <= MAP_REDUCE_THRESHOLD_TOKENS:
+        return "Transcript", text, 1
+    chunks = _chunk_by_segments(transcript)
+    if len(chunks) <= 1:
+        return "Transcript", text, 1
+    
+    logger.debug(f"Long transcript: condensing {len(chunks)} sections")
+    with ThreadPoolExecutor(max_workers=min(len(chunks), _ollama_parallelism())) as ex:
+        partials = list(ex.map(lambda c: _summarize_section(c, model, ollama_path), chunks))
+    source = "\n\n".join(f"Part {i}: {p.strip()}" for i, p in enumerate(partials, 1))
+    return "Summaries of consecutive parts of the transcript", source, len(chunks)
+
+
+def generate_summary(
+    transcript: Transcript,
+    model: str = "llama3.2",
+    ollama_path: Optional[str] = None,
+    style: str = "comprehensive"
+) -> Dict[str, Any]:
+    """
+    Generate a comprehensive summary of the video transcript.
+    
+    Args:
+        transcript: Transcript object with text and segments
+        model: Ollama model to use
+        ollama_path: Optional path to Ollama executable
+        style: Summary style - "comprehensive", "brief", "academic", "casual"
+    
+    Returns:
+        Dictionary with summary components
+    """
+    logger.info(f"Generating {style} summary (model={model})")
+    word_count = transcript.word_count
+    logger.debug(f"Transcript length: {word_count} words")
+    
+    # Long transcripts: summarize sections in parallel, then summarize those
+    try:
+        label, source, sections = _condensed_source(transcript, model, ollama_path)
+    except Exception as e:
+        logger.error(f"Failed to summarize transcript sections: {e}")
+        error_tracker.log_error(e, context="Summarizing transcript sections", module="summarize", function="generate_summary")
+        return {
+            "success": False,
+            "error": str(e),
+            "style": style,
+            "model": model,
+        }
+    if sections > 1:
+        logger.info(f"Long transcript: summarized {sections} sections first")
+    
+    # Static instructions go in the system prompt; the prompt is the text plus the checklist
+    system, suffix = STYLE_PROMPTS.get(style, STYLE_PROMPTS["casual"])
+    prompt = "".join((label, ":\n", source, suffix))
 
     try:
         logger.debug(f"Calling Ollama with {style} prompt")
-        summary_text = run_ollama(model=model, prompt=prompt, ollama_path=ollama_path, timeout=300)
+        summary_text = _run_ollama_limited(model=model, prompt=prompt, ollama_path=ollama_path, timeout=300, system=system)
         logger.info(f"Summary generated successfully ({len(summary_text)} characters)")
         
         return {
@@ -101,7 +282,8 @@ Keep it conversational and engaging."""
             "summary": summary_text,
             "style": style,
             "model": model,
-            "length": len(text.split()),
+            "length": word_count,
+            "sections": sections,
         }
     
     except Exception as e:
@@ -115,6 +297,124 @@ Keep it conversational and engaging."""
         }
 
 
+def _key_points_prompt(text: str, num_points: int, label: str = "Transcript") -> str:
+    return f"""Extract the {num_points} most important key points from this video transcript.
+
+{label}:
+{text}
+
+List exactly {num_points} key points as bullet points. Each point should be:
+- One clear sentence
+- Capture a distinct idea or insight
+- Be specific and actionable when possible
+
+Format: Return only the bullet points, one per line, starting with "- "."""
+
+
+def _topics_prompt(text: str, max_topics: int, label: str = "Transcript") -> str:
+    return f"""Identify the {max_topics} main topics or themes discussed in this video transcript.
+
+{label}:
+{text}
+
+For each topic, provide:
+- Topic name (2-4 words)
+- Brief description (one sentence)
+
+Format as:
+1. Topic Name: Description
+2. Topic Name: Description
+etc."""
+
+
+def _iter_complete_lines(fragments: Iterator[str]) -> Iterator[str]:
+    """Regroup streamed text fragments into blocks of complete lines (the tail is flushed last)."""
+    pending = ""
+    for fragment in fragments:
+        pending += fragment
+        cut = pending.rfind("\n")
+        if cut >= 0:
+            yield pending[:cut + 1]
+            pending = pending[cut + 1:]
+    if pending:
+        yield pending
+
+
+def iter_key_points(
+    transcript: Transcript,
+    model: str = "llama3.2",
+    ollama_path: Optional[str] = None,
+    num_points: int = 7
+) -> Iterator[str]:
+    """
+    Stream key points as the model writes them.
+    
+    Same prompt and parsing as extract_key_points, but each point is
+    yielded as soon as its line is complete instead of after the whole
+    response. Errors propagate as RuntimeError from run_ollama_stream.
+    
+    Args:
+        transcript: Transcript object
+        model: Ollama model
+        ollama_path: Optional Ollama path
+        num_points: Number of key points to extract
+    
+    Yields:
+        Key point strings, at most num_points
+    """
+    logger.info(f"Streaming {num_points} key points")
+    label, text, _ = _condensed_source(transcript, model, ollama_path)
+    prompt = _key_points_prompt(text, num_points, label)
+    stream = run_ollama_stream(model=model, prompt=prompt, ollama_path=ollama_path, timeout=180)
+    count = 0
+    try:
+        for block in _iter_complete_lines(stream):
+            for m in _KEY_POINT_RE.finditer(block):
+                yield m[1] or m[2]
+                count += 1
+                if count >= num_points:
+                    return
+    finally:
+        stream.close()
+
+
+def iter_topics(
+    transcript: Transcript,
+    model: str = "llama3.2",
+    ollama_path: Optional[str] = None,
+    max_topics: int = 5
+) -> Iterator[Dict[str, str]]:
+    """
+    Stream topics as the model writes them.
+    
+    Same prompt and parsing as extract_topics, yielding each topic as soon
+    as its line is complete. Errors propagate as RuntimeError from
+    run_ollama_stream.
+    
+    Args:
+        transcript: Transcript object
+        model: Ollama model
+        ollama_path: Optional Ollama path
+        max_topics: Maximum number of topics
+    
+    Yields:
+        {"name", "description"} dicts, at most max_topics
+    """
+    label, text, _ = _condensed_source(transcript, model, ollama_path)
+    prompt = _topics_prompt(text, max_topics, label)
+    stream = run_ollama_stream(model=model, prompt=prompt, ollama_path=ollama_path, timeout=180)
+    count = 0
+    try:
+        for block in _iter_complete_lines(stream):
+            for name, description in _TOPIC_RE.findall(block):
+                yield {"name": name, "description": description}
+                count += 1
+                if count >= max_topics:
+                    return
+    finally:
+        stream.close()
+
+
 def extract_key_points(
     transcript: Transcript,
     model: str = "llama3.2",
@@ -134,32 +434,14 @@ def extract_key_points(
         Dictionary with key points
     """
     logger.info(f"Extracting {num_points} key points")
-    text = transcript.text
-    
-    prompt = f"""Extract the {num_points} most important key points from this video transcript.
-
-Transcript:
-{text}
-
-List exactly {num_points} key points as bullet points. Each point should be:
-- One clear sentence
-- Capture a distinct idea or insight
-- Be specific and actionable when possible
-
-Format: Return only the bullet points, one per line, starting with "- "."""
 
     try:
-        response = run_ollama(model=model, prompt=prompt, ollama_path=ollama_path, timeout=180)
+        label, text, _ = _condensed_source(transcript, model, ollama_path)
+        prompt = _key_points_prompt(text, num_points, label)
+        response = _run_ollama_limited(model=model, prompt=prompt, ollama_path=ollama_path, timeout=180)
         
         # Parse bullet points
-        lines = response.strip().split('\n')
-        key_points = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith('- ') or line.startswith('• ') or line.startswith('* '):
-                key_points.append(line[2:].strip())
-            elif line and not line.startswith('#'):
-                key_points.append(line)
+        key_points = [m[1] or m[2] for m in _KEY_POINT_RE.finditer(response)]
         
         return {
             "success": True,
@@ -193,40 +475,16 @@ def extract_topics(
     Returns:
         Dictionary with topics
     """
-    text = transcript.text
-    
-    prompt = f"""Identify the {max_topics} main topics or themes discussed in this video transcript.
-
-Transcript:
-{text}
-
-For each topic, provide:
-- Topic name (2-4 words)
-- Brief description (one sentence)
-
-Format as:
-1. Topic Name: Description
-2. Topic Name: Description
-etc."""
-
     try:
-        response = run_ollama(model=model, prompt=prompt, ollama_path=ollama_path, timeout=180)
+        label, text, _ = _condensed_source(transcript, model, ollama_path)
+        prompt = _topics_prompt(text, max_topics, label)
+        response = _run_ollama_limited(model=model, prompt=prompt, ollama_path=ollama_path, timeout=180)
         
         # Parse topics
-        lines = response.strip().split('\n')
-        topics = []
-        for line in lines:
-            line = line.strip()
-            if ':' in line:
-                # Remove numbering if present
-                if line[0].isdigit():
-                    line = line.split('.', 1)[1].strip() if '.' in line else line
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    topics.append({
-                        "name": parts[0].strip(),
-                        "description": parts[1].strip()
-                    })
+        topics = [
+            {"name": name, "description": description}
+            for name, description in _TOPIC_RE.findall(response)
+        ]
         
         return {
             "success": True,
@@ -260,11 +518,18 @@ def generate_tldr(
     Returns:
         Dictionary with TL;DR
     """
-    text = transcript.text
+    try:
+        label, text, _ = _condensed_source(transcript, model, ollama_path)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "tldr": "",
+        }
     
     prompt = f"""Create a TL;DR (Too Long; Didn't Read) summary of this video in {max_words} words or less.
 
-Transcript:
+{label}:
 {text}
 
 Requirements:
@@ -276,7 +541,7 @@ Requirements:
 Return only the TL;DR text, nothing else."""
 
     try:
-        tldr = run_ollama(model=model, prompt=prompt, ollama_path=ollama_path, timeout=120)
+        tldr = _run_ollama_limited(model=model, prompt=prompt, ollama_path=ollama_path, timeout=120)
         
         return {
             "success": True,
@@ -301,6 +566,15 @@ def generate_full_analysis(
     """
     Generate complete analysis: summary, key points, topics, and TL;DR.
     
+    The four prompts are sent to Ollama concurrently on a shared pool of
+    FTA_OLLAMA_PARALLEL workers (default 4, capped at OLLAMA_NUM_PARALLEL
+    when set), so the analysis takes about as long as the slowest one. The
+    same limit bounds in-flight requests overall, including the section
+    summaries of a long transcript's map phase. The
+    server only runs them in parallel with OLLAMA_NUM_PARALLEL >= 4 (and
+    OLLAMA_MAX_LOADED_MODELS=1 so all four share one loaded model);
+    otherwise it queues them as before.
+    
     Args:
         transcript: Transcript object
         model: Ollama model
@@ -310,17 +584,135 @@ def generate_full_analysis(
     Returns:
         Dictionary with all analysis components
     """
-    # Run all analyses
-    summary_result = generate_summary(transcript, model, ollama_path, style)
-    points_result = extract_key_points(transcript, model, ollama_path)
-    topics_result = extract_topics(transcript, model, ollama_path)
-    tldr_result = generate_tldr(transcript, model, ollama_path)
+    # Condense a long transcript once up front; the four prompts then hit the
+    # section cache instead of each summarizing the same sections
+    try:
+        _condensed_source(transcript, model, ollama_path)
+    except Exception as e:
+        logger.warning(f"Failed to condense transcript up front: {e}")
+    
+    # Run all analyses; each one blocks on its own Ollama request
+    summary_future = _POOL.submit(generate_summary, transcript, model, ollama_path, style)
+    points_future = _POOL.submit(extract_key_points, transcript, model, ollama_path)
+    topics_future = _POOL.submit(extract_topics, transcript, model, ollama_path)
+    tldr_future = _POOL.submit(generate_tldr, transcript, model, ollama_path)
+    summary_result = summary_future.result()
+    points_result = points_future.result()
+    topics_result = topics_future.result()
+    tldr_result = tldr_future.result()
     
     return {
         "summary": summary_result,
         "key_points": points_result,
         "topics": topics_result,
         "tldr": tldr_result,
-        "transcript_length": len(transcript.text.split()),
+        "transcript_length": transcript.word_count,
+        "video_duration": transcript.segments[-1].end if transcript.segments else 0,
+    }
+
+
+# Summary guidance per style for the single-shot prompt
+_SINGLE_SHOT_STYLES = {
+    "comprehensive": "a 3-5 sentence overview followed by the main topics, target audience and key takeaways",
+    "brief": "one concise paragraph of 3-4 sentences",
+    "academic": "a formal 150-word abstract covering key concepts, main arguments and conclusions",
+    "casual": "a quick, friendly overview in simple, conversational language",
+}
+
+
+def generate_full_analysis_single_shot(
+    transcript: Transcript,
+    model: str = "llama3.2",
+    ollama_path: Optional[str] = None,
+    style: str = "comprehensive",
+    num_points: int = 7,
+    max_topics: int = 5,
+    max_words: int = 50,
+) -> Dict[str, Any]:
+    """
+    Generate the same analysis as generate_full_analysis with one Ollama call.
+    
+    The transcript is sent (and prefilled) once, and the model answers with
+    a single JSON object holding every component, instead of reading the
+    transcript four times. Falls back to generate_full_analysis if the call
+    fails or the reply isn't the expected JSON.
+    
+    Args:
+        transcript: Transcript object
+        model: Ollama model
+        ollama_path: Optional Ollama path
+        style: Summary style
+        num_points: Number of key points to extract
+        max_topics: Maximum number of topics
+        max_words: Maximum words for TL;DR
+    
+    Returns:
+        Dictionary with all analysis components, shaped like generate_full_analysis
+    """
+    logger.info(f"Generating single-shot {style} analysis (model={model})")
+    guidance = _SINGLE_SHOT_STYLES.get(style, _SINGLE_SHOT_STYLES["casual"])
+    
+    try:
+        label, text, sections = _condensed_source(transcript, model, ollama_path)
+    except Exception as e:
+        logger.warning(f"Single-shot analysis failed, falling back to separate prompts: {e}")
+        error_tracker.log_error(e, context=f"Single-shot {style} analysis", module="summarize", function="generate_full_analysis_single_shot")
+        return generate_full_analysis(transcript, model, ollama_path, style)
+    
+    prompt = f"""Analyze this video transcript.
+
+{label}:
+{text}
+
+Return valid JSON with exactly these keys:
+- "summary": string, {guidance}
+- "key_points": list of the {num_points} most important key points, each one clear sentence
+- "topics": list of up to {max_topics} objects with "name" (2-4 words) and "description" (one sentence)
+- "tldr": string, one or two sentences of at most {max_words} words capturing the essence
+
+Return only the JSON object."""
+
+    try:
+        response = _run_ollama_limited(model=model, prompt=prompt, ollama_path=ollama_path, timeout=300, output_format="json")
+        data = load_json_bytes(response.encode('utf-8'))
+        summary_text = str(data["summary"]).strip()
+        key_points = [str(p).strip() for p in data["key_points"] if str(p).strip()]
+        topics = [
+            {"name": str(t.get("name", "")).strip(), "description": str(t.get("description", "")).strip()}
+            for t in data["topics"]
+            if isinstance(t, dict)
+        ]
+        tldr = str(data["tldr"]).strip()
+    except Exception as e:
+        logger.warning(f"Single-shot analysis failed, falling back to separate prompts: {e}")
+        error_tracker.log_error(e, context=f"Single-shot {style} analysis", module="summarize", function="generate_full_analysis_single_shot")
+        return generate_full_analysis(transcript, model, ollama_path, style)
+    
+    word_count = transcript.word_count
+    return {
+        "summary": {
+            "success": True,
+            "summary": summary_text,
+            "style": style,
+            "model": model,
+            "length": word_count,
+            "sections": sections,
+        },
+        "key_points": {
+            "success": True,
+            "key_points": key_points[:num_points],
+            "raw_response": response,
+        },
+        "topics": {
+            "success": True,
+            "topics": topics[:max_topics],
+            "raw_response": response,
+        },
+        "tldr": {
+            "success": True,
+            "tldr": tldr,
+            "word_count": len(tldr.split()),
+        },
+        "transcript_length": word_count,
         "video_duration": transcript.segments[-1].end if transcript.segments else 0,
     }
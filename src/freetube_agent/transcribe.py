@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-from faster_whisper import WhisperModel
-
 from .paths import TRANSCRIPTS
 from .logger import logger, error_tracker, perf_logger
 
 
-@dataclass
+# slots: a long transcript with word timestamps holds tens of thousands of these
+@dataclass(slots=True)
 class Word:
     start: float
     end: float
@@ -31,6 +31,11 @@ class Transcript:
     segments: List[Segment]
     path: Path | None = None
 
+    @cached_property
+    def word_count(self) -> int:
+        """Whitespace-separated words in text, counted once per instance."""
+        return len(self.text.split())
+
 
 def transcribe(
     audio_path: str | Path,
@@ -50,7 +55,9 @@ def transcribe(
     """Transcribe audio using Faster-Whisper with CPU-friendly defaults.
 
     Tips for speed on CPU:
-    - use compute_type="int8" (quantized)
+    - use compute_type="int8" (quantized), or "auto" to pick the fastest
+      int8 variant this CPU supports (int8_bfloat16 / int8_float16 on
+      AVX-512 BF16 / AMX capable hardware)
     - set beam_size=1
     - prefer smaller models ("tiny" or "base")
     - optionally enable vad_filter on long audios with lots of silence
@@ -66,6 +73,8 @@ def transcribe(
     ct = compute_type
     if ct is None:
         ct = "float16" if device_ == "cuda" else "int8"
+    elif ct == "auto":
+        ct = _auto_compute_type(device_)
     
     logger.debug(f"Using device={device_}, compute_type={ct}, beam_size={beam_size}")
 
@@ -75,15 +84,7 @@ def transcribe(
     model_arg = str(model_path) if model_path else model_size
     
     try:
-        logger.debug(f"Loading Whisper model: {model_arg}")
-        model = WhisperModel(
-            model_arg,
-            device=device_,
-            compute_type=ct,
-            cpu_threads=cpu_threads_int,
-            num_workers=num_workers,
-        )
-        logger.info("Whisper model loaded successfully")
+        model = _get_whisper_model(model_arg, device_, ct, cpu_threads_int, num_workers)
     except Exception as e:
         logger.error(f"Failed to load Whisper model: {e}")
         error_tracker.log_error(e, context=f"Loading model {model_arg}", module="transcribe", function="transcribe")
@@ -107,31 +108,200 @@ def transcribe(
         logger.error(f"Transcription failed: {e}")
         error_tracker.log_error(e, context="Whisper transcription", module="transcribe", function="transcribe")
         raise
+    segs = _collect_segments(segments, word_timestamps)
+    
+    segment_count = len(segs)
+    # Segment texts are already stripped
+    full = "\n".join(seg.text for seg in segs if seg.text)
+    transcript = Transcript(text=full, segments=segs)
+    word_count = transcript.word_count
+    duration = time.time() - start_time
+    
+    logger.info(f"Transcription complete: {segment_count} segments, {word_count} words in {duration:.1f}s")
+    perf_logger.log_metric("transcribe", duration, True, {"segments": segment_count, "words": word_count, "model": model_size})
+    
+    return transcript
+
+
+def _collect_segments(segments, word_timestamps: bool, offset: float = 0.0) -> List[Segment]:
+    """Convert faster_whisper segments to Segments, shifting times by offset seconds."""
     segs: List[Segment] = []
-    lines: List[str] = []
-    segment_count = 0
+    add_seg = segs.append
+    make_word = Word
     
+    # faster_whisper decodes lazily: this loop drives the model, so keep the
+    # per-segment Python work minimal
     for s in segments:
         ws = None
-        try:
-            if getattr(s, "words", None):
-                ws = [Word(start=w.start, end=w.end, word=w.word) for w in s.words if getattr(w, "word", "").strip()]
-        except Exception:
-            ws = None
-        text = s.text.strip()
-        segs.append(Segment(start=s.start, end=s.end, text=text, words=ws))
-        if text:
-            lines.append(text)
-        segment_count += 1
-    
-    full = "\n".join(lines).strip()
-    word_count = len(full.split())
+        if word_timestamps:
+            try:
+                if s.words:
+                    ws = [make_word(w.start + offset, w.end + offset, w.word) for w in s.words if w.word.strip()]
+            except AttributeError:
+                ws = None
+        add_seg(Segment(start=s.start + offset, end=s.end + offset, text=s.text.strip(), words=ws))
+    return segs
+
+
+def transcribe_parallel(
+    audio_path: str | Path,
+    model_size: str = "base",
+    compute_type: Optional[str] = None,
+    beam_size: int = 1,
+    language: Optional[str] = "en",
+    word_timestamps: bool = False,
+    temperature: float = 0.0,
+    cpu_threads: int = 2,
+    max_workers: Optional[int] = None,
+    min_chunk_seconds: float = 30.0,
+    model_path: Optional[str | Path] = None,
+) -> Transcript:
+    """Transcribe long CPU audio by splitting it at silences and decoding the pieces in parallel.
+
+    Silero VAD (bundled with faster_whisper) finds the speech; neighbouring
+    speech regions are merged into chunks of at least min_chunk_seconds,
+    and each chunk is transcribed in its own worker process with a
+    cpu_threads-sized Whisper model. Segment times are shifted back onto
+    the original timeline. Falls back to transcribe() on CUDA or when the
+    audio yields a single chunk.
+
+    Chunks are decoded independently, so text never conditions across a
+    chunk boundary (transcribe() already defaults to
+    condition_on_previous_text=False).
+    """
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+    start_time = time.time()
+    
+    apath = Path(audio_path)
+    workers = max_workers or max(1, (os.cpu_count() or 1) // max(1, cpu_threads))
+    
+    def sequential() -> Transcript:
+        return transcribe(
+            apath,
+            model_size=model_size,
+            compute_type=compute_type,
+            beam_size=beam_size,
+            language=language,
+            word_timestamps=word_timestamps,
+            temperature=temperature,
+            model_path=model_path,
+        )
+    
+    if workers < 2 or _has_cuda():
+        return sequential()
+    
+    try:
+        from faster_whisper.audio import decode_audio
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        
+        sampling_rate = 16000
+        audio = decode_audio(str(apath), sampling_rate=sampling_rate)
+        speech = get_speech_timestamps(audio, VadOptions())
+    except Exception as e:
+        logger.error(f"Failed to split audio for parallel transcription: {e}")
+        error_tracker.log_error(e, context=f"VAD split of {apath.name}", module="transcribe", function="transcribe_parallel")
+        raise
+    
+    # Merge speech regions (sample offsets) into chunks of at least min_chunk_seconds
+    min_samples = int(min_chunk_seconds * sampling_rate)
+    chunks: List[tuple[int, int]] = []
+    for region in speech:
+        if chunks and chunks[-1][1] - chunks[-1][0] < min_samples:
+            chunks[-1] = (chunks[-1][0], region["end"])
+        else:
+            chunks.append((region["start"], region["end"]))
+    
+    if len(chunks) < 2:
+        return sequential()
+    
+    logger.info(f"Parallel transcription: {apath.name} in {len(chunks)} chunks on {workers} workers (model={model_size})")
+    
+    ct = compute_type or "int8"
+    if ct == "auto":
+        ct = _auto_compute_type("cpu")
+    model_arg = str(model_path) if model_path else model_size
+    options = {
+        "language": language,
+        "beam_size": beam_size,
+        "word_timestamps": word_timestamps,
+        "temperature": temperature,
+    }
+    
+    try:
+        # spawn: forking a process that already holds CTranslate2/torch threads is unsafe
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=get_context("spawn")) as ex:
+            futures = [
+                ex.submit(_transcribe_chunk, audio[lo:hi], lo / sampling_rate, model_arg, ct, cpu_threads, options)
+                for lo, hi in chunks
+            ]
+            segs = [seg for fut in futures for seg in fut.result()]
+    except Exception as e:
+        logger.error(f"Parallel transcription failed: {e}")
+        error_tracker.log_error(e, context=f"Parallel transcription of {apath.name}", module="transcribe", function="transcribe_parallel")
+        raise
+    
+    full = "\n".join(seg.text for seg in segs if seg.text)
+    transcript = Transcript(text=full, segments=segs)
+    word_count = transcript.word_count
     duration = time.time() - start_time
     
-    logger.info(f"Transcription complete: {segment_count} segments, {word_count} words in {duration:.1f}s")
-    perf_logger.log_metric("transcribe", duration, True, {"segments": segment_count, "words": word_count, "model": model_size})
+    logger.info(f"Transcription complete: {len(segs)} segments, {word_count} words in {duration:.1f}s")
+    perf_logger.log_metric("transcribe_parallel", duration, True, {"segments": len(segs), "words": word_count, "model": model_size, "chunks": len(chunks)})
     
-    return Transcript(text=full, segments=segs)
+    return transcript
+
+
+def _transcribe_chunk(audio, offset: float, model_arg: str, compute_type: str, cpu_threads: int, options: dict) -> List[Segment]:
+    """Worker for transcribe_parallel: transcribe one audio slice starting at offset seconds."""
+    model = _get_whisper_model(model_arg, "cpu", compute_type, cpu_threads, 1)
+    segments, _ = model.transcribe(
+        audio,
+        language=options["language"],
+        task="transcribe",
+        beam_size=options["beam_size"],
+        best_of=max(1, options["beam_size"]),
+        word_timestamps=options["word_timestamps"],
+        condition_on_previous_text=False,
+        temperature=options["temperature"],
+    )
+    return _collect_segments(segments, options["word_timestamps"], offset)
+
+
+@lru_cache(maxsize=4)
+def _get_whisper_model(model_arg: str, device: str, compute_type: str, cpu_threads: int, num_workers: int):
+    """
+    Load a WhisperModel once per configuration and share it between calls.
+
+    CTranslate2 models are safe to transcribe with from several threads,
+    so concurrent callers can share an instance.
+    """
+    logger.debug(f"Loading Whisper model: {model_arg}")
+    from faster_whisper import WhisperModel
+
+    model = WhisperModel(
+        model_arg,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+    logger.info("Whisper model loaded successfully")
+    return model
+
+
+def unload_models() -> None:
+    """Drop the cached Whisper models so their memory can be reclaimed."""
+    _get_whisper_model.cache_clear()
+    import gc
+
+    gc.collect()
+
+
+_WRITE_BUFFER = 1 << 20
+_WRITE_SLICE = 1 << 18
 
 
 def save_transcript(t: Transcript, video_stem: str, output_dir: Path | None = None) -> Path:
@@ -140,7 +310,12 @@ def save_transcript(t: Transcript, video_stem: str, output_dir: Path | None = No
     path = out_dir / f"{video_stem}.txt"
     
     try:
-        path.write_text(t.text, encoding="utf-8")
+        # Encode and write in slices so a multi-MB transcript is never
+        # duplicated as one full-size bytes object
+        text = t.text
+        with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+            for i in range(0, len(text), _WRITE_SLICE):
+                f.write(text[i:i + _WRITE_SLICE])
         t.path = path
         logger.info(f"Transcript saved: {path}")
         return path
@@ -150,6 +325,35 @@ def save_transcript(t: Transcript, video_stem: str, output_dir: Path | None = No
         raise
 
 
+# Fastest first; all keep int8 weights and differ in the activation type
+_CPU_COMPUTE_TYPES = ("int8_bfloat16", "int8_float16", "int8")
+
+
+@lru_cache(maxsize=None)
+def _auto_compute_type(device: str) -> str:
+    """Pick the fastest quantized compute type CTranslate2 supports on this device."""
+    if device == "cuda":
+        return "float16"
+    try:
+        import ctranslate2
+
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception:
+        return "int8"
+    for ct in _CPU_COMPUTE_TYPES:
+        if ct in supported:
+            logger.debug(f"Auto-selected compute_type={ct} (supported: {sorted(supported)})")
+            return ct
+    return "int8"
+
+
+async def save_transcript_async(t: Transcript, video_stem: str, output_dir: Path | None = None) -> Path:
+    """save_transcript on a worker thread, so async callers don't block their event loop."""
+    import asyncio
+
+    return await asyncio.to_thread(save_transcript, t, video_stem, output_dir)
+
+
 def _has_cuda() -> bool:
     try:
         import torch
@@ -0,0 +1,22 @@
+from freetube_agent.analytics import analyze_transcript, get_word_frequency
+
+
+def test_analyze_transcript_counts_whitespace_separated_words():
+    text = "State-of-the-art models scored 3.5 points. Models, models! Don't panic?"
+
+    analysis = analyze_transcript(text)
+
+    words = text.split()
+    assert analysis["word_count"] == len(words) == 9
+    assert analysis["avg_word_length"] == round(sum(map(len, words)) / len(words), 2)
+    # "models", "Models," and "models!" are one word once case and punctuation go
+    assert analysis["unique_word_count"] == 7
+
+
+def test_word_frequency_counts_alphabetic_content_words():
+    text = "State-of-the-art models scored 3.5 points. Models, models! Don't panic?"
+
+    assert dict(get_word_frequency(text, 10)) == {
+        "models": 3, "state": 1, "scored": 1, "points": 1, "panic": 1,
+    }
+    assert dict(analyze_transcript(text)["top_words"]) == dict(get_word_frequency(text, 20))
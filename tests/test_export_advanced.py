@@ -0,0 +1,21 @@
+import re
+
+import pytest
+
+from freetube_agent.export_advanced import export_to_pdf
+from freetube_agent.transcribe import Segment, Transcript
+
+
+def test_export_to_pdf_includes_every_segment_of_a_long_transcript(tmp_path, monkeypatch):
+    rl_config = pytest.importorskip("reportlab.rl_config")
+    # Uncompressed content streams keep the drawn text searchable in the file
+    monkeypatch.setattr(rl_config, "pageCompression", 0)
+
+    # Well past _LazyStory's 500-flowable batches, so the story is refilled many times
+    segments = [Segment(start=i * 2.0, end=i * 2.0 + 2.0, text=f"seg{i:04d}") for i in range(1200)]
+    transcript = Transcript(text=" ".join(s.text for s in segments), segments=segments)
+
+    out = export_to_pdf(transcript, "Long video", output_path=tmp_path / "long.pdf")
+
+    drawn = set(re.findall(rb"seg(\d{4})", out.read_bytes()))
+    assert drawn == {f"{i:04d}".encode() for i in range(1200)}
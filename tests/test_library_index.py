@@ -0,0 +1,40 @@
+import random
+
+from freetube_agent import library_index
+
+
+def _fresh_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(library_index, "TRANSCRIPTS", tmp_path)
+    monkeypatch.setattr(library_index, "INDEX_PATH", tmp_path / "search.idx")
+    monkeypatch.setattr(library_index, "_docs", {})
+    monkeypatch.setattr(library_index, "_postings", {})
+    monkeypatch.setattr(library_index, "_loaded", False)
+
+
+def test_candidate_stems_never_drops_a_transcript_containing_the_query(tmp_path, monkeypatch):
+    _fresh_index(tmp_path, monkeypatch)
+    rng = random.Random(7)
+    vocab = ["machine", "learning", "model", "learn", "deep", "net", "network", "data", "set", "dataset"]
+    texts = {}
+    for i in range(30):
+        words = [rng.choice(vocab) for _ in range(rng.randint(5, 40))]
+        texts[f"t{i}"] = " ".join(words) + rng.choice([".", "!", ""])
+        (tmp_path / f"t{i}.txt").write_text(texts[f"t{i}"], encoding="utf-8")
+
+    for _ in range(300):
+        text = texts[rng.choice(list(texts))].lower()
+        lo = rng.randrange(len(text))
+        query = text[lo:lo + rng.randint(1, 30)]
+        candidates = library_index.candidate_stems(query)
+        expected = {stem for stem, t in texts.items() if query in t.lower()}
+        assert candidates is None or expected <= candidates, query
+
+
+def test_candidate_stems_looks_up_inner_words_exactly(tmp_path, monkeypatch):
+    _fresh_index(tmp_path, monkeypatch)
+    (tmp_path / "a.txt").write_text("we train a deep network model", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("we train a deep networking model", encoding="utf-8")
+
+    assert library_index.candidate_stems("deep network model") == {"a"}
+    # Edge words may be parts of longer words
+    assert library_index.candidate_stems("eep networ") == {"a", "b"}
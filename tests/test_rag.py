@@ -0,0 +1,66 @@
+import threading
+
+from freetube_agent import rag
+
+
+class _FakeCollection:
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+        self.ids = []
+
+    def count(self):
+        return len(self.ids)
+
+    def upsert(self, ids, documents, metadatas):
+        self.calls.append((self.name, threading.get_ident()))
+        self.ids.extend(ids)
+
+
+def test_batch_index_all_indexes_concurrently_read_transcripts(tmp_path, monkeypatch):
+    for i in range(12):
+        text = "\n\n".join(f"Paragraph {p} of video {i}. " + "word " * 120 for p in range(6))
+        (tmp_path / f"video{i}.txt").write_text(text, encoding="utf-8")
+
+    calls = []
+    collections = {}
+    monkeypatch.setattr(rag, "get_indexed_videos", lambda: [])
+    monkeypatch.setattr(rag, "get_collection", lambda name: collections.setdefault(name, _FakeCollection(name, calls)))
+
+    results = rag.batch_index_all(transcript_dir=tmp_path)
+
+    assert results == {"indexed": 12, "skipped": 0, "failed": 0, "errors": []}
+    assert sorted(collections) == sorted(f"video{i}" for i in range(12))
+    assert all(col.count() > 0 for col in collections.values())
+    # Embedding/upserting is confined to the calling thread
+    assert {ident for _, ident in calls} == {threading.get_ident()}
+
+
+def test_batch_index_all_skips_indexed_and_reports_failures(tmp_path, monkeypatch):
+    (tmp_path / "done.txt").write_text("Already indexed.", encoding="utf-8")
+    (tmp_path / "new.txt").write_text("Fresh transcript text.", encoding="utf-8")
+    (tmp_path / "bad.txt").write_bytes(b"\xff\xfe not utf-8 \xff")
+
+    calls = []
+    done = _FakeCollection("done", calls)
+    done.ids.append("done_chunk_1")
+    collections = {"done": done}
+    monkeypatch.setattr(rag, "get_indexed_videos", lambda: ["done"])
+    monkeypatch.setattr(rag, "get_collection", lambda name: collections.setdefault(name, _FakeCollection(name, calls)))
+
+    results = rag.batch_index_all(transcript_dir=tmp_path)
+
+    assert (results["indexed"], results["skipped"], results["failed"]) == (1, 1, 1)
+    assert results["errors"][0].startswith("bad: ")
+    assert [name for name, _ in calls] == ["new"]
+
+
+def test_retrieve_relevant_chunks_sees_chunks_added_after_a_query():
+    chunks = [{"text": "alpha beta", "start": 0.0, "end": 1.0}]
+    assert rag.retrieve_relevant_chunks("gamma", chunks, top_k=1) == []
+
+    chunks.append({"text": "gamma delta", "start": 1.0, "end": 2.0})
+    assert [c["text"] for c in rag.retrieve_relevant_chunks("gamma", chunks, top_k=1)] == ["gamma delta"]
+
+    chunks[-1] = {"text": "epsilon", "start": 1.0, "end": 2.0}
+    assert [c["text"] for c in rag.retrieve_relevant_chunks("epsilon", chunks, top_k=1)] == ["epsilon"]